@@ -0,0 +1,59 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_01"
+down_revision = "20260108_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "skill_trend_monthly",
+        sa.Column("month", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("title_key", sa.String(length=500), nullable=False),
+        sa.Column("city_key", sa.String(length=100), nullable=False),
+        sa.Column("skill_key", sa.String(length=255), nullable=False),
+        sa.Column("job_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("month", "title_key", "city_key", "skill_key"),
+    )
+    op.create_index("ix_skill_trend_monthly_skill_month", "skill_trend_monthly", ["skill_key", "month"])
+
+    # Backfill from existing jobs; afterwards app.rollups keeps it current.
+    op.execute(
+        """
+        INSERT INTO skill_trend_monthly (month, title_key, city_key, skill_key, job_count)
+        WITH jm AS (
+            SELECT
+                j.id,
+                date_trunc('month', j.date) AS month,
+                lower(j.title) AS title_key,
+                COALESCE(
+                    (
+                        SELECT min(lower(l.city))
+                        FROM job_location jl
+                        JOIN location l ON l.id = jl.location_id
+                        WHERE jl.job_id = j.id
+                    ),
+                    ''
+                ) AS city_key
+            FROM job j
+            WHERE j.date IS NOT NULL
+        )
+        SELECT month, title_key, city_key, '', count(*)
+        FROM jm
+        GROUP BY month, title_key, city_key
+        UNION ALL
+        SELECT jm.month, jm.title_key, jm.city_key, lower(s.name), count(DISTINCT jm.id)
+        FROM jm
+        JOIN job_skills js ON js.job_id = jm.id
+        JOIN skill s ON s.id = js.skill_id
+        GROUP BY jm.month, jm.title_key, jm.city_key, lower(s.name)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_skill_trend_monthly_skill_month", table_name="skill_trend_monthly")
+    op.drop_table("skill_trend_monthly")
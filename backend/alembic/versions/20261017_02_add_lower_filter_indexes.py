@@ -0,0 +1,46 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_02"
+down_revision = "20261017_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY keeps job/location writable during the build; it cannot run
+    # inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        # equality / IN on lower(...)
+        op.create_index(
+            "ix_job_title_lower", "job", [sa.text("lower(title)")],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_skill_name_lower", "skill", [sa.text("lower(name)")],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+
+        # substring search (lower(...) LIKE '%' || q || '%')
+        op.create_index(
+            "ix_skill_name_lower_trgm", "skill", [sa.text("lower(name) gin_trgm_ops")],
+            postgresql_using="gin", postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            "ix_location_city_lower_trgm", "location", [sa.text("lower(city) gin_trgm_ops")],
+            postgresql_using="gin", postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in [
+            ("ix_location_city_lower_trgm", "location"),
+            ("ix_skill_name_lower_trgm", "skill"),
+            ("ix_skill_name_lower", "skill"),
+            ("ix_job_title_lower", "job"),
+        ]:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,29 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_03"
+down_revision = "20261017_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingest_row",
+        sa.Column("row_hash", sa.String(length=64), primary_key=True),
+        sa.Column("job_id", sa.Integer(), sa.ForeignKey("job.id", ondelete="CASCADE"), nullable=False),
+    )
+    op.create_index("ix_ingest_row_job_id", "ingest_row", ["job_id"])
+    op.create_table(
+        "ingest_watermark",
+        sa.Column("source", sa.String(length=255), primary_key=True),
+        sa.Column("max_date", sa.Date(), nullable=False),
+        sa.Column("loaded_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("ingest_watermark")
+    op.drop_index("ix_ingest_row_job_id", table_name="ingest_row")
+    op.drop_table("ingest_row")
@@ -0,0 +1,21 @@
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_04"
+down_revision = "20261017_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "report_data_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+    )
+    op.execute("INSERT INTO report_data_version (id, version) VALUES (1, 0)")
+
+
+def downgrade() -> None:
+    op.drop_table("report_data_version")
@@ -0,0 +1,68 @@
+from alembic import op
+
+
+revision = "20261017_05"
+down_revision = "20261017_04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rebuild as app.rollups now writes it: one '*' city row per job, since
+    # location-filtered trends are counted from the base tables.
+    op.execute("DELETE FROM skill_trend_monthly")
+    op.execute(
+        """
+        INSERT INTO skill_trend_monthly (month, title_key, city_key, skill_key, job_count)
+        WITH jm AS (
+            SELECT j.id, date_trunc('month', j.date) AS month, lower(j.title) AS title_key, '*' AS city_key
+            FROM job j
+            WHERE j.date IS NOT NULL
+        )
+        SELECT month, title_key, city_key, '', count(*)
+        FROM jm
+        GROUP BY month, title_key, city_key
+        UNION ALL
+        SELECT jm.month, jm.title_key, jm.city_key, lower(s.name), count(DISTINCT jm.id)
+        FROM jm
+        JOIN job_skills js ON js.job_id = jm.id
+        JOIN skill s ON s.id = js.skill_id
+        GROUP BY jm.month, jm.title_key, jm.city_key, lower(s.name)
+        """
+    )
+
+
+def downgrade() -> None:
+    # Back to the 20261017_01 layout: one row per job under its first city.
+    op.execute("DELETE FROM skill_trend_monthly")
+    op.execute(
+        """
+        INSERT INTO skill_trend_monthly (month, title_key, city_key, skill_key, job_count)
+        WITH jm AS (
+            SELECT
+                j.id,
+                date_trunc('month', j.date) AS month,
+                lower(j.title) AS title_key,
+                COALESCE(
+                    (
+                        SELECT min(lower(l.city))
+                        FROM job_location jl
+                        JOIN location l ON l.id = jl.location_id
+                        WHERE jl.job_id = j.id
+                    ),
+                    ''
+                ) AS city_key
+            FROM job j
+            WHERE j.date IS NOT NULL
+        )
+        SELECT month, title_key, city_key, '', count(*)
+        FROM jm
+        GROUP BY month, title_key, city_key
+        UNION ALL
+        SELECT jm.month, jm.title_key, jm.city_key, lower(s.name), count(DISTINCT jm.id)
+        FROM jm
+        JOIN job_skills js ON js.job_id = jm.id
+        JOIN skill s ON s.id = js.skill_id
+        GROUP BY jm.month, jm.title_key, jm.city_key, lower(s.name)
+        """
+    )
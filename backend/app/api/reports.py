@@ -4,11 +4,14 @@ from datetime import datetime, timedelta, timezone
 from typing import Literal
 
 from fastapi import APIRouter, Body, Depends, Query
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, literal_column, select, true
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
-from app.models import Company, Job, Location, Skill, DataSource
+from app.cache import norm_key, norm_skills_key, report_cache, report_key
+from app.db import get_async_db
+from app.models import Company, Job, Location, Skill, DataSource, SkillTrendMonthly
+from app.rollups import ALL_CITIES
 
 
 router = APIRouter(prefix="/reports")
@@ -26,11 +29,18 @@ def _cutoff_from_window(window: str) -> datetime:
 
 
 @router.get("/job-skill-distribution")
-def report_job_skill_distribution(
+async def report_job_skill_distribution(
     job_title: str = Query(..., min_length=1),
     location: str | None = Query(default=None),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
+    key = await report_key(db, "job-skill-distribution", norm_key(job_title), norm_key(location))
+    result = await report_cache.aget_or_set(key, lambda: _job_skill_distribution(db, job_title, location))
+    # echo the caller's own spelling, not the one that populated the cache entry
+    return {**result, "job_title": job_title, "location": location}
+
+
+async def _job_skill_distribution(db: AsyncSession, job_title: str, location: str | None) -> dict:
     universe = select(Job.id).where(func.lower(Job.title) == job_title.lower())
     if location:
         universe = (
@@ -39,7 +49,7 @@ def report_job_skill_distribution(
         )
     universe = universe.distinct().subquery()
 
-    total_jobs = db.execute(select(func.count()).select_from(universe)).scalar_one()
+    total_jobs = (await db.execute(select(func.count()).select_from(universe))).scalar_one()
     if total_jobs == 0:
         return {"job_title": job_title, "location": location, "total_jobs": 0, "skills": []}
 
@@ -51,7 +61,7 @@ def report_job_skill_distribution(
         .group_by(Skill.name)
         .order_by(func.count().desc(), Skill.name.asc())
     )
-    rows = db.execute(counts_stmt).all()
+    rows = (await db.execute(counts_stmt)).all()
     total_mentions = sum(int(r[1]) for r in rows) or 0
 
     skills = []
@@ -63,36 +73,64 @@ def report_job_skill_distribution(
 
 
 @router.get("/skill-trend")
-def report_skill_trend(
+async def report_skill_trend(
     skill: str = Query(..., min_length=1),
     job_title: str | None = Query(default=None),
     location: str | None = Query(default=None),
     bucket: Literal["month"] = Query(default="month"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    month = func.date_trunc("month", Job.date).label("month")
+    if location:
+        rows = await _skill_trend_for_location(db, skill, job_title, location)
+        return {"skill": skill, "job_title": job_title, "location": location, "points": _trend_points(rows)}
 
-    stmt = select(
-        month,
-        func.count(func.distinct(Job.id)).label("total_jobs"),
-        func.count(func.distinct(Job.id))
-        .filter(func.lower(Skill.name) == skill.lower())
-        .label("jobs_with_skill"),
-    ).select_from(Job)
+    # Served from the skill_trend_monthly rollup (see app.rollups) instead of
+    # re-aggregating the job/skill join on every request.
+    r = SkillTrendMonthly
+    skill_key = skill.lower()
+
+    stmt = (
+        select(
+            r.month,
+            func.sum(r.job_count).filter(r.skill_key == "").label("total_jobs"),
+            func.coalesce(func.sum(r.job_count).filter(r.skill_key == skill_key), 0).label("jobs_with_skill"),
+        )
+        .where(r.skill_key.in_(["", skill_key]), r.city_key == ALL_CITIES)
+        .group_by(r.month)
+        .order_by(r.month.asc())
+    )
 
     if job_title:
-        stmt = stmt.where(func.lower(Job.title) == job_title.lower())
-    if location:
-        stmt = stmt.join(Job.locations).where(func.lower(Location.city).contains(location.lower()))
+        stmt = stmt.where(r.title_key == job_title.lower())
+
+    rows = (await db.execute(stmt)).all()
+    return {"skill": skill, "job_title": job_title, "location": location, "points": _trend_points(rows)}
 
+
+async def _skill_trend_for_location(db: AsyncSession, skill: str, job_title: str | None, location: str):
+    # A job listed in several matching cities must still count once, so this
+    # counts distinct jobs on the base tables rather than summing rollup rows.
+    month = func.date_trunc("month", Job.date).label("month")
     stmt = (
-        stmt.outerjoin(Job.skills)
+        select(
+            month,
+            func.count(func.distinct(Job.id)).label("total_jobs"),
+            func.count(func.distinct(Job.id)).filter(func.lower(Skill.name) == skill.lower()).label("jobs_with_skill"),
+        )
+        .select_from(Job)
+        .join(Job.locations)
+        .where(func.lower(Location.city).contains(location.lower()))
+        .outerjoin(Job.skills)
         .where(Job.date.is_not(None))
         .group_by(month)
         .order_by(month.asc())
     )
+    if job_title:
+        stmt = stmt.where(func.lower(Job.title) == job_title.lower())
+    return (await db.execute(stmt)).all()
+
 
-    rows = db.execute(stmt).all()
+def _trend_points(rows) -> list[dict]:
     points = []
     for m, total, with_skill in rows:
         if not m:
@@ -101,46 +139,116 @@ def report_skill_trend(
         x = f"{dt.month:02d}.{dt.year}"
         y = (float(with_skill) / float(total) * 100.0) if total else 0.0
         points.append({"x": x, "y": round(y, 1)})
-
-    return {"skill": skill, "job_title": job_title, "location": location, "points": points}
+    return points
 
 
 @router.get("/skill-top-job-titles")
-def report_skill_top_job_titles(
+async def report_skill_top_job_titles(
     skill: str = Query(..., min_length=1),
     limit: int = Query(default=5, ge=1, le=50),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    stmt = (
-        select(
-            Job.title.label("job_title"),
-            func.count(func.distinct(Job.id)).label("total_jobs"),
-            func.count(func.distinct(Job.id))
-            .filter(func.lower(Skill.name) == skill.lower())
-            .label("jobs_with_skill"),
-        )
-        .select_from(Job)
-        .outerjoin(Job.skills)
+    key = await report_key(db, "skill-top-job-titles", norm_key(skill), limit)
+    return await report_cache.aget_or_set(key, lambda: _skill_top_job_titles(db, skill, limit))
+
+
+async def _skill_top_job_titles(db: AsyncSession, skill: str, limit: int) -> list[dict]:
+    # Only titles that have at least one job with the skill can rank, so
+    # aggregate those first and count totals just for them; the ranking and
+    # LIMIT run in Postgres so only `limit` rows come back.
+    with_skill = (
+        select(Job.title.label("job_title"), func.count(func.distinct(Job.id)).label("jobs_with_skill"))
+        .join(Job.skills)
+        .where(func.lower(Skill.name) == skill.lower())
         .group_by(Job.title)
+        .cte("with_skill")
     )
-    rows = db.execute(stmt).all()
+    totals = (
+        select(Job.title.label("job_title"), func.count(Job.id).label("total_jobs"))
+        .where(Job.title.in_(select(with_skill.c.job_title)))
+        .group_by(Job.title)
+        .subquery()
+    )
+    percentage = (with_skill.c.jobs_with_skill * 100.0 / totals.c.total_jobs).label("percentage")
+
+    stmt = (
+        select(with_skill.c.job_title, percentage)
+        .join(totals, totals.c.job_title == with_skill.c.job_title)
+        .order_by(percentage.desc(), with_skill.c.job_title.asc())
+        .limit(limit)
+    )
+    rows = (await db.execute(stmt)).all()
+    return [{"job_title": title, "percentage": round(float(pct), 1)} for title, pct in rows]
 
-    result = []
-    for title, total, with_skill in rows:
-        if not total or not with_skill:
-            continue
-        pct = float(with_skill) / float(total) * 100.0
-        result.append({"job_title": title, "percentage": round(pct, 1)})
 
-    result.sort(key=lambda r: r["percentage"], reverse=True)
-    return result[:limit]
+def _json_rows(rows, *order_by, **fields):
+    """Scalar subquery aggregating `rows` into a JSON array of objects ('[]' when empty)."""
+    obj = func.json_build_object(*[x for name, col in fields.items() for x in (literal_column(f"'{name}'"), col)])
+    return select(
+        func.coalesce(func.json_agg(aggregate_order_by(obj, *order_by)), literal_column("'[]'::json"), type_=JSON)
+    ).select_from(rows).scalar_subquery()
+
+
+def _last_announcements_json(universe):
+    """Five most recent jobs of `universe` with the first data_source.link of each."""
+    last = (
+        select(Job.id, Job.title, Company.name.label("company"), Job.date)
+        .select_from(universe)
+        .join(Job, Job.id == universe.c.id)
+        .outerjoin(Company, Company.id == Job.company_id)
+        .order_by(Job.date.desc())
+        .limit(5)
+        .subquery("last")
+    )
+    # looked up only for the five selected jobs, not for every row of the universe
+    link = (
+        select(DataSource.link)
+        .where(DataSource.job_id == last.c.id)
+        .order_by(DataSource.id.asc())
+        .limit(1)
+        .lateral("link")
+    )
+    rows = select(last, link.c.link).select_from(last).outerjoin(link, true()).subquery("last_rows")
+    return _json_rows(
+        rows,
+        rows.c.date.desc(),
+        id=rows.c.id,
+        title=rows.c.title,
+        company=rows.c.company,
+        date=rows.c.date,
+        url=rows.c.link,
+    )
+
+
+def _announcements_from_json(items: list[dict]) -> list[dict]:
+    return [
+        {
+            "id": r["id"],
+            "title": r["title"],
+            "company": r["company"],
+            "date": datetime.fromisoformat(r["date"]).date().isoformat() if r["date"] else None,
+            "url": r["url"].strip() if r["url"] else None,
+        }
+        for r in items
+    ]
 
 
 @router.post("/jobs-by-skills")
-def report_jobs_by_skills(
+async def report_jobs_by_skills(
     payload: dict = Body(..., examples=[{"skills": ["Python", "SQL"], "location": "London", "time_window": "1m"}]),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
+    key = await report_key(
+        db,
+        "jobs-by-skills",
+        norm_skills_key(payload.get("skills")),
+        norm_key(payload.get("location")),
+        str(payload.get("time_window", "1m")),
+    )
+    return await report_cache.aget_or_set(key, lambda: _jobs_by_skills(db, payload))
+
+
+async def _jobs_by_skills(db: AsyncSession, payload: dict) -> dict:
     skills_in = payload.get("skills") or []
     location = payload.get("location")
     time_window = payload.get("time_window", "1m")
@@ -160,67 +268,62 @@ def report_jobs_by_skills(
     if location:
         universe = universe.join(Job.locations).where(func.lower(Location.city).contains(str(location).lower()))
 
-    universe = universe.distinct().subquery()
-    total_jobs = db.execute(select(func.count()).select_from(universe)).scalar_one()
-    if total_jobs == 0:
-        return {"job_titles": [], "top_job_title": None, "last_announcements": []}
+    # All sections are computed in one statement over a shared universe CTE.
+    universe = universe.distinct().cte("universe")
 
-    dist_stmt = (
-        select(Job.title, func.count(func.distinct(Job.id)).label("count"))
+    dist = (
+        select(Job.title.label("name"), func.count(func.distinct(Job.id)).label("count"))
         .select_from(universe)
         .join(Job, Job.id == universe.c.id)
         .group_by(Job.title)
-        .order_by(func.count(func.distinct(Job.id)).desc(), Job.title.asc())
+        .subquery("dist")
+    )
+    stmt = select(
+        select(func.count()).select_from(universe).scalar_subquery().label("total_jobs"),
+        _json_rows(dist, dist.c.count.desc(), dist.c.name.asc(), name=dist.c.name, count=dist.c.count).label(
+            "job_titles"
+        ),
+        _last_announcements_json(universe).label("last_announcements"),
     )
-    dist_rows = db.execute(dist_stmt).all()
+    total_jobs, dist_rows, last_rows = (await db.execute(stmt)).one()
+    if total_jobs == 0:
+        return {"job_titles": [], "top_job_title": None, "last_announcements": []}
 
     job_titles = []
     top_job_title = None
-    for i, (title, count) in enumerate(dist_rows):
+    for i, r in enumerate(dist_rows):
         if i == 0:
-            top_job_title = title
-        pct = float(count) / float(total_jobs) * 100.0
-        job_titles.append({"name": title, "count": int(count), "percent": round(pct, 1)})
+            top_job_title = r["name"]
+        pct = float(r["count"]) / float(total_jobs) * 100.0
+        job_titles.append({"name": r["name"], "count": int(r["count"]), "percent": round(pct, 1)})
 
-    # include first available data_source.link for each job (if any)
-    last_stmt = (
-        select(
-            Job.id,
-            Job.title,
-            Company.name,
-            Job.date,
-            select(DataSource.link).where(DataSource.job_id == Job.id).limit(1).scalar_subquery().label("link"),
-        )
-        .select_from(universe)
-        .join(Job, Job.id == universe.c.id)
-        .outerjoin(Company, Company.id == Job.company_id)
-        .order_by(Job.date.desc())
-        .limit(5)
-    )
-    last_rows = db.execute(last_stmt).all()
-    last_announcements = [
-        {
-            "id": r[0],
-            "title": r[1],
-            "company": r[2],
-            "date": r[3].date().isoformat() if r[3] else None,
-            "url": r[4].strip() if len(r) > 4 and r[4] else None,
-        }
-        for r in last_rows
-    ]
+    last_announcements = _announcements_from_json(last_rows)
 
     return {"job_titles": job_titles, "top_job_title": top_job_title, "last_announcements": last_announcements}
 
 
 @router.post("/job-title-details")
-def report_job_title_details(
+async def report_job_title_details(
     payload: dict = Body(..., examples=[{"job_title": "Backend Developer", "location": "Remote", "time_window": "1m"}]),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     job_title = payload.get("job_title")
     if not job_title:
         return {"top_skills": [], "top_companies": [], "last_announcements": []}
 
+    key = await report_key(
+        db,
+        "job-title-details",
+        norm_key(job_title),
+        norm_skills_key(payload.get("skills")),
+        norm_key(payload.get("location")),
+        str(payload.get("time_window", "1m")),
+    )
+    return await report_cache.aget_or_set(key, lambda: _job_title_details(db, payload))
+
+
+async def _job_title_details(db: AsyncSession, payload: dict) -> dict:
+    job_title = payload.get("job_title")
     skills_in = payload.get("skills") or []
     location = payload.get("location")
     time_window = payload.get("time_window", "1m")
@@ -238,63 +341,54 @@ def report_job_title_details(
         skills_lower = [str(s).lower() for s in skills_in if str(s).strip()]
         base = base.join(Job.skills).where(func.lower(Skill.name).in_(skills_lower))
 
-    universe = base.distinct().subquery()
-    total_jobs = db.execute(select(func.count()).select_from(universe)).scalar_one()
-    if total_jobs == 0:
-        return {"top_skills": [], "top_companies": [], "last_announcements": []}
+    # All sections are computed in one statement over a shared universe CTE.
+    universe = base.distinct().cte("universe")
 
-    skills_stmt = (
-        select(Skill.name, func.count(func.distinct(Job.id)).label("count"))
+    skill_counts = (
+        select(Skill.name.label("name"), func.count(func.distinct(Job.id)).label("count"))
         .select_from(universe)
         .join(Job, Job.id == universe.c.id)
         .join(Job.skills)
         .group_by(Skill.name)
         .order_by(func.count(func.distinct(Job.id)).desc(), Skill.name.asc())
         .limit(25)
+        .subquery("skill_counts")
     )
-    skill_rows = db.execute(skills_stmt).all()
-    top_skills = []
-    for name, count in skill_rows:
-        pct = float(count) / float(total_jobs) * 100.0
-        top_skills.append({"name": name, "count": int(count), "percent": round(pct, 1)})
-
-    comp_stmt = (
-        select(Company.name, func.count(func.distinct(Job.id)).label("count"))
+    comp_counts = (
+        select(Company.name.label("name"), func.count(func.distinct(Job.id)).label("count"))
         .select_from(universe)
         .join(Job, Job.id == universe.c.id)
         .outerjoin(Company, Company.id == Job.company_id)
         .group_by(Company.name)
         .order_by(func.count(func.distinct(Job.id)).desc())
         .limit(3)
+        .subquery("comp_counts")
     )
-    comp_rows = db.execute(comp_stmt).all()
-    top_companies = [{"name": r[0], "count": int(r[1])} for r in comp_rows if r[0]]
-
-    # include first available data_source.link for each job (if any)
-    last_stmt = (
-        select(
-            Job.id,
-            Job.title,
-            Company.name,
-            Job.date,
-            select(DataSource.link).where(DataSource.job_id == Job.id).limit(1).scalar_subquery().label("link"),
-        )
-        .select_from(universe)
-        .join(Job, Job.id == universe.c.id)
-        .outerjoin(Company, Company.id == Job.company_id)
-        .order_by(Job.date.desc())
-        .limit(5)
+    stmt = select(
+        select(func.count()).select_from(universe).scalar_subquery().label("total_jobs"),
+        _json_rows(
+            skill_counts,
+            skill_counts.c.count.desc(),
+            skill_counts.c.name.asc(),
+            name=skill_counts.c.name,
+            count=skill_counts.c.count,
+        ).label("top_skills"),
+        _json_rows(comp_counts, comp_counts.c.count.desc(), name=comp_counts.c.name, count=comp_counts.c.count).label(
+            "top_companies"
+        ),
+        _last_announcements_json(universe).label("last_announcements"),
     )
-    last_rows = db.execute(last_stmt).all()
-    last_announcements = [
-        {
-            "id": r[0],
-            "title": r[1],
-            "company": r[2],
-            "date": r[3].date().isoformat() if r[3] else None,
-            "url": r[4].strip() if len(r) > 4 and r[4] else None,
-        }
-        for r in last_rows
-    ]
+    total_jobs, skill_rows, comp_rows, last_rows = (await db.execute(stmt)).one()
+    if total_jobs == 0:
+        return {"top_skills": [], "top_companies": [], "last_announcements": []}
+
+    top_skills = []
+    for r in skill_rows:
+        pct = float(r["count"]) / float(total_jobs) * 100.0
+        top_skills.append({"name": r["name"], "count": int(r["count"]), "percent": round(pct, 1)})
+
+    top_companies = [{"name": r["name"], "count": int(r["count"])} for r in comp_rows if r["name"]]
+
+    last_announcements = _announcements_from_json(last_rows)
 
     return {"top_skills": top_skills, "top_companies": top_companies, "last_announcements": last_announcements, "total_jobs": total_jobs}
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Path, Query
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
+from app.db import get_async_db
 from app.models import Course, Skill
 
 
@@ -12,10 +12,10 @@ router = APIRouter()
 
 
 @router.get("/skills/{skill}/courses")
-def list_courses_for_skill(
+async def list_courses_for_skill(
     skill: str = Path(..., min_length=1),
     limit: int = Query(default=5, ge=1, le=50),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     stmt = (
         select(Course.title, Course.semester, Course.url)
@@ -24,5 +24,5 @@ def list_courses_for_skill(
         .order_by(Course.title.asc())
         .limit(limit)
     )
-    rows = db.execute(stmt).all()
+    rows = (await db.execute(stmt)).all()
     return [{"title": r[0], "semester": r[1], "url": r[2]} for r in rows]
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import random
+import threading
 import time
 from typing import Any
+from urllib.parse import parse_qsl
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -28,69 +30,156 @@ def _try_json(text: str) -> Any:
         return None
 
 
-class APILoggingMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, enabled: bool, max_bytes: int = 4096):
-        super().__init__(app)
-        self.enabled = enabled
-        self.max_bytes = max_bytes
-
-    async def dispatch(self, request: Request, call_next) -> Response:
-        if not self.enabled or not request.url.path.startswith("/api/"):
-            return await call_next(request)
-
-        start = time.perf_counter()
+def _preview(body: bytes, content_type: str, max_bytes: int) -> Any:
+    if not body:
+        return None
+    raw_text = _safe_decode(body, max_bytes)
+    if "application/json" in content_type:
+        return _try_json(raw_text) or raw_text
+    return raw_text
 
-        body_bytes = await request.body()
 
-        async def receive():
-            return {"type": "http.request", "body": body_bytes, "more_body": False}
+class _Tee:
+    """Keeps at most `limit` bytes of a stream without holding the rest."""
 
-        request._receive = receive
+    __slots__ = ("buf", "limit")
 
-        req_ct = (request.headers.get("content-type") or "").lower()
-        req_body_preview: Any = None
-        if body_bytes:
-            raw_text = _safe_decode(body_bytes, self.max_bytes)
-            if "application/json" in req_ct:
-                req_body_preview = _try_json(raw_text) or raw_text
-            else:
-                req_body_preview = raw_text
+    def __init__(self, limit: int):
+        self.buf = bytearray()
+        self.limit = limit
 
-        response = await call_next(request)
-        status = response.status_code
-        resp_ct = (response.headers.get("content-type") or "").lower()
+    def feed(self, chunk: bytes) -> None:
+        room = self.limit - len(self.buf)
+        if room > 0 and chunk:
+            self.buf += chunk[:room]
 
-        resp_body_preview: Any = None
-        resp_body_bytes = b""
-        try:
-            async for chunk in response.body_iterator:  # type: ignore[attr-defined]
-                resp_body_bytes += chunk
-        except Exception:
-            resp_body_bytes = b""
 
-        if resp_body_bytes:
-            raw_text = _safe_decode(resp_body_bytes, self.max_bytes)
-            if "application/json" in resp_ct:
-                resp_body_preview = _try_json(raw_text) or raw_text
-            else:
-                resp_body_preview = raw_text
+class _LogWorker:
+    """Formats and emits log records on a daemon thread, off the request path."""
 
-        duration_ms = round((time.perf_counter() - start) * 1000, 1)
+    def __init__(self, max_pending: int = 10_000):
+        self._queue: queue.Queue[tuple] = queue.Queue(maxsize=max_pending)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.dropped = 0
 
+    def submit(self, record: tuple) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="api-logging", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            record = self._queue.get()
+            try:
+                self._emit(*record)
+            except Exception:
+                logger.exception("API logging failed")
+
+    @staticmethod
+    def _emit(method, path, query_string, status, duration_ms, req_ct, req_body, resp_ct, resp_body, max_bytes):
         logger.info(
             "API %s %s status=%s ms=%s query=%s req_body=%s resp_body=%s",
-            request.method,
-            request.url.path,
+            method,
+            path,
             status,
             duration_ms,
-            dict(request.query_params),
-            req_body_preview,
-            resp_body_preview,
+            dict(parse_qsl(query_string.decode("latin-1"))),
+            _preview(req_body, req_ct, max_bytes),
+            _preview(resp_body, resp_ct, max_bytes),
         )
 
-        return Response(
-            content=resp_body_bytes,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.media_type,
-        )
+
+_worker = _LogWorker()
+
+
+class APILoggingMiddleware:
+    """Pure ASGI request/response logger for /api/ routes.
+
+    Only the first `max_bytes` of each body are kept; the stream itself is
+    passed through untouched. `sample_rate` (0..1) selects which requests are
+    logged and paths starting with any of `exclude_paths` are skipped.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        enabled: bool,
+        max_bytes: int = 4096,
+        sample_rate: float = 1.0,
+        exclude_paths: list[str] | tuple[str, ...] = (),
+    ):
+        self.app = app
+        self.enabled = enabled
+        self.max_bytes = max_bytes
+        self.sample_rate = sample_rate
+        self.exclude_paths = tuple(exclude_paths)
+
+    def _should_log(self, scope: Scope) -> bool:
+        if not self.enabled or scope["type"] != "http":
+            return False
+        path = scope["path"]
+        if not path.startswith("/api/") or (self.exclude_paths and path.startswith(self.exclude_paths)):
+            return False
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._should_log(scope):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        req_tee = _Tee(self.max_bytes)
+        resp_tee = _Tee(self.max_bytes)
+        status = 500
+        resp_ct = ""
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                req_tee.feed(message.get("body", b""))
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, resp_ct
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for k, v in message.get("headers", []):
+                    if k.lower() == b"content-type":
+                        resp_ct = v.decode("latin-1").lower()
+                        break
+            elif message["type"] == "http.response.body":
+                resp_tee.feed(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            req_ct = ""
+            for k, v in scope.get("headers", []):
+                if k.lower() == b"content-type":
+                    req_ct = v.decode("latin-1").lower()
+                    break
+            _worker.submit(
+                (
+                    scope["method"],
+                    scope["path"],
+                    scope.get("query_string", b""),
+                    status,
+                    round((time.perf_counter() - start) * 1000, 1),
+                    req_ct,
+                    bytes(req_tee.buf),
+                    resp_ct,
+                    bytes(resp_tee.buf),
+                    self.max_bytes,
+                )
+            )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import argparse
+import json
+from typing import Any
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+from app.models import Job, Location, Skill
+
+
+def _statements(job_title: str, skill: str, city: str) -> dict[str, Any]:
+    """The case-insensitive filters used by reports.py / meta.py / skills.py."""
+    return {
+        "job.lower(title) =": select(Job.id).where(func.lower(Job.title) == job_title.lower()),
+        "skill.lower(name) IN": select(Skill.id).where(func.lower(Skill.name).in_([skill.lower()])),
+        "skill.lower(name) LIKE %q%": select(Skill.id).where(func.lower(Skill.name).contains(skill.lower())),
+        "location.lower(city) LIKE %q%": select(Location.id).where(
+            func.lower(Location.city).contains(city.lower())
+        ),
+    }
+
+
+def _walk(node: dict) -> list[str]:
+    out = [node["Node Type"] + (f" on {node['Index Name']}" if "Index Name" in node else "")]
+    for child in node.get("Plans", []):
+        out.extend(_walk(child))
+    return out
+
+
+def _explain(db: Session, stmt) -> tuple[list[str], float]:
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    plan = db.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    root = plan[0]
+    return _walk(root["Plan"]), float(root["Execution Time"])
+
+
+def run(job_title: str, skill: str, city: str, repeat: int) -> None:
+    with SessionLocal() as db:
+        for name, stmt in _statements(job_title, skill, city).items():
+            results = {}
+            for mode in ("seqscan", "indexed"):
+                db.rollback()
+                if mode == "seqscan":
+                    # emulate the pre-migration plan without dropping anything
+                    db.execute(text("SET LOCAL enable_indexscan = off"))
+                    db.execute(text("SET LOCAL enable_bitmapscan = off"))
+                timings = []
+                nodes: list[str] = []
+                for _ in range(repeat):
+                    nodes, ms = _explain(db, stmt)
+                    timings.append(ms)
+                results[mode] = (nodes, min(timings))
+            db.rollback()
+
+            print(name)
+            for mode, (nodes, ms) in results.items():
+                print(f"  {mode:<8} {ms:>9.3f} ms  {' > '.join(nodes)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare plans for the lower(...) filters with and without indexes.")
+    parser.add_argument("--job-title", type=str, default="Backend Developer")
+    parser.add_argument("--skill", type=str, default="python")
+    parser.add_argument("--city", type=str, default="berlin")
+    parser.add_argument("--repeat", type=int, default=5, help="EXPLAIN ANALYZE runs per plan (best is reported)")
+    args = parser.parse_args()
+
+    run(job_title=args.job_title, skill=args.skill, city=args.city, repeat=args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from app.config import settings
+from app.seed import seed
+
+
+def _synthetic_jobs(n: int, seed_value: int) -> list[dict]:
+    rnd = random.Random(seed_value)
+    titles = [f"Title {i}" for i in range(200)]
+    cities = [f"City {i}" for i in range(300)]
+    companies = [f"Company {i}" for i in range(2000)]
+    skills = [f"Skill {i}" for i in range(1500)]
+    start = date(2024, 1, 1)
+    return [
+        {
+            "id": i + 1,
+            "title": rnd.choice(titles),
+            "location": rnd.choice(cities),
+            "company": rnd.choice(companies),
+            "skills": rnd.sample(skills, rnd.randint(3, 12)),
+            "date_posted": (start + timedelta(days=rnd.randint(0, 700))).isoformat(),
+            "salary": rnd.randint(30_000, 120_000),
+            "description": "lorem ipsum " * rnd.randint(20, 200),
+        }
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare ORM and COPY seeding throughput. WIPES the job tables (runs seed --reset)."
+    )
+    parser.add_argument("--jobs", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic dataset")
+    parser.add_argument("--skip-orm", action="store_true", help="Only time the bulk path")
+    args = parser.parse_args()
+
+    if settings.environment == "prod":
+        raise SystemExit("Refusing to run the seeding benchmark against a prod environment.")
+
+    jobs = _synthetic_jobs(args.jobs, args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench_seed.json"
+        path.write_text(json.dumps({"jobs": jobs, "courses": []}), encoding="utf-8")
+
+        modes = [("bulk", True)] if args.skip_orm else [("orm", False), ("bulk", True)]
+        for name, bulk in modes:
+            start = time.perf_counter()
+            seed(seed_path=path, reset=True, bulk=bulk)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<5} {args.jobs} jobs in {elapsed:8.2f} s  ({args.jobs / elapsed:10.0f} jobs/s)")
+
+
+if __name__ == "__main__":
+    main()
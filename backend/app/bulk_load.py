@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import csv
+import io
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+@dataclass
+class JobRecord:
+    id: int
+    title: str
+    date: datetime | None = None
+    salary: int | None = None
+    description: str | None = None
+    company: str | None = None
+    city: str | None = None
+    country: str | None = None
+    continent: str | None = None
+    skills: list[str] = field(default_factory=list)
+    # None leaves the job's existing fields / data sources untouched
+    fields: list[str] | None = None
+    source_name: str | None = None
+    source_link: str | None = None
+
+
+def _norm(s: str) -> str:
+    return " ".join(s.strip().split()).lower()
+
+
+def _copy_rows(db: Session, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> None:
+    """COPY rows into `table` over the session's own connection/transaction."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        # CSV COPY reads an unquoted empty field as NULL
+        writer.writerow(["" if v is None else v for v in row])
+    buf.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf)
+    finally:
+        cursor.close()
+
+
+_STAGE_TABLES = """
+    DROP TABLE IF EXISTS
+        stage_job, stage_job_skill, stage_job_field, stage_company, stage_location, stage_skill, stage_field;
+    CREATE TEMP TABLE stage_job (
+        ord integer, id bigint, title text, date timestamptz, salary integer, description text,
+        company text, company_key text, city text, country text, continent text, location_key text,
+        has_fields boolean, source_name text, source_link text
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE stage_job_skill (ord integer, job_id bigint, skill text, skill_key text) ON COMMIT DROP;
+    CREATE TEMP TABLE stage_job_field (ord integer, job_id bigint, field text, field_key text) ON COMMIT DROP;
+"""
+
+# Dimension names are matched on _norm() keys within one load (first spelling
+# wins), then on the exact stored name, as the ORM path in seed.py does.
+# Locations without country/continent match on city alone (seed data).
+_LOCATION_MATCH = """
+    l.city = s.city AND (
+        (s.country IS NULL AND s.continent IS NULL)
+        OR (l.country IS NOT DISTINCT FROM s.country AND l.continent IS NOT DISTINCT FROM s.continent)
+    )
+"""
+_RESOLVE = """
+    CREATE TEMP TABLE stage_company ON COMMIT DROP AS
+        SELECT DISTINCT ON (company_key) company_key, company AS name
+        FROM stage_job WHERE company_key IS NOT NULL ORDER BY company_key, ord;
+    INSERT INTO company (name) SELECT name FROM stage_company ON CONFLICT (name) DO NOTHING;
+
+    CREATE TEMP TABLE stage_location ON COMMIT DROP AS
+        SELECT DISTINCT ON (location_key) location_key, city, country, continent
+        FROM stage_job WHERE location_key IS NOT NULL ORDER BY location_key, ord;
+    INSERT INTO location (city, country, continent)
+        SELECT s.city, s.country, s.continent FROM stage_location s
+        WHERE NOT EXISTS (SELECT 1 FROM location l WHERE {location_match});
+
+    CREATE TEMP TABLE stage_skill ON COMMIT DROP AS
+        SELECT DISTINCT ON (skill_key) skill_key, skill AS name
+        FROM stage_job_skill ORDER BY skill_key, ord;
+    INSERT INTO skill (name) SELECT name FROM stage_skill ON CONFLICT (name) DO NOTHING;
+
+    CREATE TEMP TABLE stage_field ON COMMIT DROP AS
+        SELECT DISTINCT ON (field_key) field_key, field AS name
+        FROM stage_job_field ORDER BY field_key, ord;
+    INSERT INTO field (name) SELECT name FROM stage_field ON CONFLICT (name) DO NOTHING;
+
+    INSERT INTO job (id, title, date, salary, description, company_id)
+        SELECT s.id, s.title, s.date, s.salary, s.description, c.id
+        FROM stage_job s
+        LEFT JOIN stage_company sc ON sc.company_key = s.company_key
+        LEFT JOIN company c ON c.name = sc.name
+    ON CONFLICT (id) DO UPDATE SET
+        title = EXCLUDED.title,
+        date = EXCLUDED.date,
+        salary = EXCLUDED.salary,
+        description = EXCLUDED.description,
+        company_id = EXCLUDED.company_id;
+
+    DELETE FROM job_location WHERE job_id IN (SELECT id FROM stage_job);
+    INSERT INTO job_location (job_id, location_id)
+        SELECT sj.id, (SELECT min(l.id) FROM location l WHERE {location_match})
+        FROM stage_job sj
+        JOIN stage_location s ON s.location_key = sj.location_key;
+
+    DELETE FROM job_skills WHERE job_id IN (SELECT id FROM stage_job);
+    INSERT INTO job_skills (job_id, skill_id)
+        SELECT DISTINCT ss.job_id, k.id
+        FROM stage_job_skill ss
+        JOIN stage_skill sk ON sk.skill_key = ss.skill_key
+        JOIN skill k ON k.name = sk.name;
+
+    DELETE FROM job_field WHERE job_id IN (SELECT id FROM stage_job WHERE has_fields);
+    INSERT INTO job_field (job_id, field_id)
+        SELECT DISTINCT sf.job_id, f.id
+        FROM stage_job_field sf
+        JOIN stage_field fk ON fk.field_key = sf.field_key
+        JOIN field f ON f.name = fk.name;
+
+    DELETE FROM data_source WHERE job_id IN (SELECT id FROM stage_job WHERE source_name IS NOT NULL);
+    INSERT INTO data_source (name, link, job_id)
+        SELECT source_name, source_link, id FROM stage_job WHERE source_name IS NOT NULL;
+""".format(location_match=_LOCATION_MATCH)
+
+
+def bulk_load_jobs(db: Session, jobs: Iterable[JobRecord]) -> list[int]:
+    """Upsert jobs with their company, location, skills, fields and source using COPY + set-based SQL.
+
+    Replaces each loaded job's locations and skills, like seed.upsert_job, and
+    its fields / data source when the record carries them.
+    Runs inside the caller's transaction; returns the loaded job ids.
+    """
+    # later duplicates of an id win, matching sequential upserts
+    by_id: dict[int, JobRecord] = {}
+    for j in jobs:
+        if not j.title:
+            raise ValueError("Job missing title")
+        by_id[int(j.id)] = j
+    if not by_id:
+        return []
+
+    db.execute(text(_STAGE_TABLES))
+
+    job_rows = []
+    skill_rows = []
+    field_rows = []
+    for ord_, j in enumerate(by_id.values()):
+        company = j.company or None
+        city = j.city or None
+        country = j.country or None
+        continent = j.continent or None
+        location_key = "|".join(_norm(x) if x else "" for x in (city, country, continent)) if city else None
+        job_rows.append(
+            (
+                ord_,
+                j.id,
+                j.title,
+                j.date.isoformat() if j.date else None,
+                j.salary,
+                j.description,
+                company,
+                _norm(company) if company else None,
+                city,
+                country,
+                continent,
+                location_key,
+                j.fields is not None,
+                j.source_name or None,
+                j.source_link or None,
+            )
+        )
+        # row position as ord, so the first spelling also wins within one job
+        for s in j.skills:
+            if str(s).strip():
+                skill_rows.append((len(skill_rows), j.id, s, _norm(str(s))))
+        for f in j.fields or []:
+            if str(f).strip():
+                field_rows.append((len(field_rows), j.id, f, _norm(str(f))))
+
+    _copy_rows(
+        db,
+        "stage_job",
+        (
+            "ord", "id", "title", "date", "salary", "description", "company", "company_key",
+            "city", "country", "continent", "location_key", "has_fields", "source_name", "source_link",
+        ),
+        job_rows,
+    )
+    _copy_rows(db, "stage_job_skill", ("ord", "job_id", "skill", "skill_key"), skill_rows)
+    _copy_rows(db, "stage_job_field", ("ord", "job_id", "field", "field_key"), field_rows)
+
+    db.execute(text(_RESOLVE))
+    return list(by_id)
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+
+class TTLLRUCache:
+    """Thread-safe in-process cache with per-entry TTL and LRU eviction."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        if not self.enabled:
+            return False, None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        found, value = self.get(key)
+        if found:
+            return value
+        value = compute()
+        self.set(key, value)
+        return value
+
+    async def aget_or_set(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        found, value = self.get(key)
+        if found:
+            return value
+        value = await compute()
+        self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+report_cache = TTLLRUCache(
+    max_entries=settings.report_cache_max_entries,
+    ttl_seconds=settings.report_cache_ttl_seconds,
+    enabled=settings.report_cache_enabled,
+)
+
+
+def norm_key(value: Any) -> str | None:
+    """Lowercase a filter value the same way the report queries do."""
+    return str(value).lower() if value else None
+
+
+def norm_skills_key(skills: Any) -> tuple[str, ...] | None:
+    """Order-insensitive key for a skills list; None when no list was given."""
+    if not isinstance(skills, list) or not skills:
+        return None
+    return tuple(sorted({str(s).lower() for s in skills}))
+
+
+def bump_report_data_version(db: Session) -> None:
+    """Mark every API process's cached reports stale.
+
+    Run inside the transaction that changes job data (seed, ingest), so the
+    new version becomes visible together with the data it describes.
+    """
+    db.execute(
+        text(
+            "INSERT INTO report_data_version (id, version) VALUES (1, 1) "
+            "ON CONFLICT (id) DO UPDATE SET version = report_data_version.version + 1"
+        )
+    )
+
+
+_version: int | None = None
+_version_checked_at = 0.0
+_version_lock = asyncio.Lock()
+
+
+def _version_fresh() -> bool:
+    return _version is not None and time.monotonic() - _version_checked_at < settings.report_cache_version_poll_seconds
+
+
+async def report_data_version(db: AsyncSession) -> int:
+    """report_data_version as last seen by this process, re-read at most once per poll interval.
+
+    Between polls this needs no database round trip. When a poll finds a new
+    version, the cache is cleared and the version swapped under one lock.
+    """
+    global _version, _version_checked_at
+    if _version_fresh():
+        return _version
+    async with _version_lock:
+        if _version_fresh():
+            return _version
+        result = await db.execute(text("SELECT version FROM report_data_version WHERE id = 1"))
+        version = result.scalar_one_or_none() or 0
+        if _version is not None and version != _version:
+            report_cache.clear()
+        _version = version
+        _version_checked_at = time.monotonic()
+        return version
+
+
+async def report_key(db: AsyncSession, *parts: Any) -> tuple:
+    """Cache key for a report: its parts prefixed with the current report_data_version.
+
+    Entries cached under an older version are never hit again; new data
+    reaches cached reports within REPORT_CACHE_VERSION_POLL_SECONDS.
+    """
+    if not report_cache.enabled:
+        return parts
+    return (await report_data_version(db), *parts)
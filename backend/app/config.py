@@ -8,13 +8,39 @@ class Settings(BaseSettings):
     environment: str = "dev"
 
     database_url: str
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800
+    db_pool_timeout: float = 30.0
+    db_pool_pre_ping: bool = True
+    # >0 replaces the per-checkout ping with one only after this many idle seconds
+    db_pool_idle_ping_seconds: float = 0.0
     cors_origins: str = "http://localhost:5173,http://127.0.0.1:5173"
     log_api: bool = True
     log_api_max_bytes: int = 4096
+    log_api_sample_rate: float = 1.0
+    log_api_exclude_paths: str = ""
+    metrics_enabled: bool = True
+
+    report_cache_enabled: bool = True
+    report_cache_ttl_seconds: float = 300.0
+    report_cache_max_entries: int = 1024
+    # how often each process re-reads report_data_version (see app.cache)
+    report_cache_version_poll_seconds: float = 1.0
+
+    @property
+    def async_database_url(self) -> str:
+        """database_url with its driver swapped for asyncpg."""
+        scheme, sep, rest = self.database_url.partition("://")
+        return f"{scheme.split('+', 1)[0]}+asyncpg{sep}{rest}"
 
     @property
     def cors_origin_list(self) -> list[str]:
         return [o.strip() for o in self.cors_origins.split(",") if o.strip()]
 
+    @property
+    def log_api_exclude_path_list(self) -> list[str]:
+        return [p.strip() for p in self.log_api_exclude_paths.split(",") if p.strip()]
+
 
 settings = Settings()
@@ -1,5 +1,9 @@
-from sqlalchemy import create_engine
+import time
+
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from app.config import settings
 
@@ -8,9 +12,88 @@ class Base(DeclarativeBase):
     pass
 
 
+class _CheckoutStatsMixin:
+    """Counts checkouts that were not served instantly from the idle queue.
+
+    A "wait" is any checkout slower than 1 ms: blocked on a free slot or
+    opening a new connection. Timeouts are counted separately as well.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            if waited > 0.001:
+                self.waits += 1
+                self.wait_seconds += waited
+                self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def recreate(self):
+        # keep the counters across pool re-creation after a disconnect
+        new = super().recreate()
+        new.checkouts, new.waits, new.timeouts = self.checkouts, self.waits, self.timeouts
+        new.wait_seconds, new.max_wait_seconds = self.wait_seconds, self.max_wait_seconds
+        return new
+
+
+class InstrumentedQueuePool(_CheckoutStatsMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutStatsMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def _pool_kwargs() -> dict:
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_timeout": settings.db_pool_timeout,
+        # with an idle-ping interval configured, connections are only pinged
+        # after sitting unused that long (see _ping_idle_connections)
+        "pool_pre_ping": settings.db_pool_pre_ping and not settings.db_pool_idle_ping_seconds,
+    }
+
+
+def _ping_idle_connections(sync_engine, idle_seconds: float) -> None:
+    @event.listens_for(sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < idle_seconds:
+            return
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("SELECT 1")
+        except Exception as e:
+            # makes the pool discard this connection and retry with a fresh one
+            raise exc.DisconnectionError() from e
+        finally:
+            cursor.close()
+
+
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
+    **_pool_kwargs(),
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
@@ -22,3 +105,43 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# asyncpg-backed engine used by the API routes; the sync engine above stays
+# for alembic, seeding and other scripts.
+async_engine = create_async_engine(
+    settings.async_database_url,
+    poolclass=InstrumentedAsyncQueuePool,
+    **_pool_kwargs(),
+)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+if settings.db_pool_idle_ping_seconds:
+    _ping_idle_connections(engine, settings.db_pool_idle_ping_seconds)
+    _ping_idle_connections(async_engine.sync_engine, settings.db_pool_idle_ping_seconds)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def _stats_for(pool) -> dict:
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "checkouts": getattr(pool, "checkouts", 0),
+        "waits": getattr(pool, "waits", 0),
+        "wait_seconds": round(getattr(pool, "wait_seconds", 0.0), 3),
+        "max_wait_seconds": round(getattr(pool, "max_wait_seconds", 0.0), 3),
+        "timeouts": getattr(pool, "timeouts", 0),
+    }
+
+
+def pool_stats() -> dict:
+    """Snapshot of both connection pools for /health/pool."""
+    return {"sync": _stats_for(engine.pool), "async": _stats_for(async_engine.sync_engine.pool)}
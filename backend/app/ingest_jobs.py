@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import argparse
+import ast
+import csv
+import gzip
+import hashlib
+import io
+import sys
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.bulk_load import JobRecord, bulk_load_jobs
+from app.cache import bump_report_data_version
+from app.db import SessionLocal
+from app.rollups import months_for_jobs, refresh_skill_trend
+
+
+# Output of data_pipeline/scheduler.py (data_pipeline/job_store.py layout)
+DATASET_PATH_DEFAULT = Path(__file__).resolve().parents[2] / "data_pipeline" / "data" / "job_data" / "ALL_JOBS_parquet"
+
+# Rows this many days older than a source's watermark are still checked
+# against the hash index, so late-arriving scrapes are not lost.
+WATERMARK_OVERLAP_DAYS = 3
+
+_UNKNOWN = {"", "unknown", "nan", "none"}
+
+
+def _clean(value) -> str | None:
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if value.lower() in _UNKNOWN else value
+
+
+def _parse_list(value) -> list[str]:
+    """Skills/Field cells are a list (Parquet), a Python list repr or a comma separated string."""
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if v is not None and str(v).strip()]
+    value = str(value or "").strip()
+    if not value:
+        return []
+    if value.startswith("["):
+        try:
+            parsed = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            parsed = None
+        if isinstance(parsed, (list, tuple)):
+            return [str(v).strip() for v in parsed if str(v).strip()]
+        value = value.strip("[]")
+    return [v.strip().strip("'\"") for v in value.split(",") if v.strip().strip("'\"")]
+
+
+def _parse_date(value) -> date | None:
+    value = str(value or "").strip()
+    if len(value) < 10:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def row_hash(row: dict) -> str:
+    key = "\x1f".join(
+        " ".join(str(row.get(c) or "").split()).lower()
+        for c in ("Job Title", "Company", "City", "Country", "Date", "URL")
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def iter_chunks(path: Path, chunk_size: int, watermarks: dict[str, date] | None = None) -> Iterator[list[dict]]:
+    """Stream the pipeline dataset in lists of at most chunk_size rows.
+
+    `path` is either the partitioned Parquet store (a directory) or a legacy
+    ALL_JOBS.csv(.gz). For the store, partitions older than the watermarks are
+    pruned before any file is read.
+    """
+    if path.is_dir():
+        yield from _iter_parquet_chunks(path, chunk_size, watermarks or {})
+        return
+
+    csv.field_size_limit(sys.maxsize)
+    raw = gzip.open(path, "rb") if path.suffix == ".gz" else open(path, "rb")
+    with raw, io.TextIOWrapper(raw, encoding="utf-8", newline="") as f:
+        chunk: list[dict] = []
+        for row in csv.DictReader(f):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _iter_parquet_chunks(path: Path, chunk_size: int, watermarks: dict[str, date]) -> Iterator[list[dict]]:
+    # pyarrow is only needed for the Parquet store, not by the API itself
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([("Website", pa.string()), ("Date", pa.string())]), flavor="hive")
+    dataset = ds.dataset(path, format="parquet", partitioning=partitioning)
+
+    expr = None
+    if watermarks:
+        website, day = ds.field("Website"), ds.field("Date")
+        expr = ~website.isin(list(watermarks))
+        for source, mark in watermarks.items():
+            since = (mark - timedelta(days=WATERMARK_OVERLAP_DAYS)).isoformat()
+            expr = expr | ((website == source) & (day >= since))
+
+    for batch in dataset.to_batches(filter=expr, batch_size=chunk_size):
+        if batch.num_rows:
+            yield batch.to_pylist()
+
+
+def load_watermarks(db: Session) -> dict[str, date]:
+    return {r[0]: r[1] for r in db.execute(text("SELECT source, max_date FROM ingest_watermark")).all()}
+
+
+def save_watermarks(db: Session, watermarks: dict[str, date]) -> None:
+    if not watermarks:
+        return
+    stmt = text(
+        """
+        INSERT INTO ingest_watermark (source, max_date, loaded_at)
+        VALUES (:source, :max_date, now())
+        ON CONFLICT (source) DO UPDATE SET
+            max_date = GREATEST(ingest_watermark.max_date, EXCLUDED.max_date),
+            loaded_at = EXCLUDED.loaded_at
+        """
+    )
+    db.execute(stmt, [{"source": k, "max_date": v} for k, v in watermarks.items()])
+
+
+def _existing_hashes(db: Session, hashes: list[str]) -> set[str]:
+    if not hashes:
+        return set()
+    stmt = text("SELECT row_hash FROM ingest_row WHERE row_hash IN :hashes").bindparams(
+        bindparam("hashes", expanding=True)
+    )
+    return {r[0] for r in db.execute(stmt, {"hashes": hashes}).all()}
+
+
+def _allocate_job_ids(db: Session, n: int) -> list[int]:
+    rows = db.execute(text("SELECT nextval('job_id_seq') FROM generate_series(1, :n)"), {"n": n}).all()
+    return [int(r[0]) for r in rows]
+
+
+def ingest_chunk(
+    db: Session,
+    rows: list[dict],
+    watermarks: dict[str, date],
+    new_watermarks: dict[str, date],
+) -> list[int]:
+    """Load the rows of one chunk that are not in the database yet; returns new job ids."""
+    candidates: dict[str, tuple[dict, date | None, str]] = {}
+    for row in rows:
+        title = _clean(row.get("Job Title"))
+        if not title:
+            continue
+        source = _clean(row.get("Website")) or "unknown"
+        day = _parse_date(row.get("Date"))
+        mark = watermarks.get(source)
+        if mark is not None and day is not None and day < mark - timedelta(days=WATERMARK_OVERLAP_DAYS):
+            continue
+        candidates.setdefault(row_hash(row), (row, day, source))
+
+    existing = _existing_hashes(db, list(candidates))
+    new = [(h, row, day, source) for h, (row, day, source) in candidates.items() if h not in existing]
+    if not new:
+        return []
+
+    ids = _allocate_job_ids(db, len(new))
+    records = []
+    for job_id, (_, row, day, source) in zip(ids, new):
+        records.append(
+            JobRecord(
+                id=job_id,
+                title=_clean(row.get("Job Title")),
+                date=datetime(day.year, day.month, day.day, tzinfo=timezone.utc) if day else None,
+                description=_clean(row.get("Description")),
+                company=_clean(row.get("Company")),
+                city=_clean(row.get("City")),
+                country=_clean(row.get("Country")),
+                continent=_clean(row.get("Continent")),
+                skills=_parse_list(row.get("Skills")),
+                fields=_parse_list(row.get("Field")),
+                source_name=source,
+                source_link=_clean(row.get("URL")),
+            )
+        )
+        if day is not None and (source not in new_watermarks or day > new_watermarks[source]):
+            new_watermarks[source] = day
+
+    bulk_load_jobs(db, records)
+    db.execute(
+        text("INSERT INTO ingest_row (row_hash, job_id) VALUES (:row_hash, :job_id)"),
+        [{"row_hash": h, "job_id": job_id} for job_id, (h, _, _, _) in zip(ids, new)],
+    )
+    return ids
+
+
+def ingest(path: Path, chunk_size: int = 5000, full: bool = False) -> int:
+    """Incrementally load the pipeline dataset; each chunk is committed on its own."""
+    total = 0
+    with SessionLocal() as db:
+        watermarks = {} if full else load_watermarks(db)
+        new_watermarks: dict[str, date] = {}
+
+        for i, rows in enumerate(iter_chunks(path, chunk_size, watermarks), start=1):
+            ids = ingest_chunk(db, rows, watermarks, new_watermarks)
+            if ids:
+                refresh_skill_trend(db, months_for_jobs(db, ids))
+                # same transaction as the chunk, so API workers see the new jobs and version together
+                bump_report_data_version(db)
+            db.commit()
+            total += len(ids)
+            print(f"chunk {i}: {len(rows)} rows, {len(ids)} new")
+
+        save_watermarks(db, new_watermarks)
+        db.commit()
+
+    return total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Load new rows of the pipeline's ALL_JOBS dataset into Postgres.")
+    parser.add_argument(
+        "--path", type=str, default=str(DATASET_PATH_DEFAULT), help="Parquet job store directory or ALL_JOBS.csv(.gz)"
+    )
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--full", action="store_true", help="Ignore the date watermark (hash dedup still applies)")
+    args = parser.parse_args()
+
+    path = Path(args.path)
+    if not path.exists():
+        raise FileNotFoundError(f"Dataset not found: {path}. Run data_pipeline/scheduler.py first.")
+
+    total = ingest(path, chunk_size=args.chunk_size, full=args.full)
+    print(f"Loaded {total} new jobs")
+
+
+if __name__ == "__main__":
+    main()
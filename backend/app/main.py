@@ -1,14 +1,34 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api.router import api_router
 from app.api_logging import APILoggingMiddleware
+from app.db import async_engine, engine, pool_stats
 
 
 app = FastAPI(title=settings.app_name)
 
-app.add_middleware(APILoggingMiddleware, enabled=settings.log_api, max_bytes=settings.log_api_max_bytes)
+if settings.metrics_enabled:
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+
+    from app.metrics import MetricsMiddleware, instrument_engine, register_stats_collector
+
+    register_stats_collector()
+    instrument_engine(engine, "sync")
+    instrument_engine(async_engine.sync_engine, "async")
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+app.add_middleware(
+    APILoggingMiddleware,
+    enabled=settings.log_api,
+    max_bytes=settings.log_api_max_bytes,
+    sample_rate=settings.log_api_sample_rate,
+    exclude_paths=settings.log_api_exclude_path_list,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -18,15 +38,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# added last so it is outermost and times the whole middleware stack
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 
 @app.on_event("startup")
 def _startup() -> None:
     return
 
 
+@app.on_event("shutdown")
+async def _shutdown() -> None:
+    await async_engine.dispose()
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
 
 
+@app.get("/health/pool")
+def health_pool():
+    return pool_stats()
+
+
 app.include_router(api_router)
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import time
+
+from prometheus_client import REGISTRY, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.cache import report_cache
+from app.db import pool_stats
+
+
+HTTP_REQUEST_DURATION = Histogram(
+    "employeah_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "employeah_http_requests_in_flight",
+    "HTTP requests currently being served.",
+    ["method"],
+)
+DB_STATEMENT_DURATION = Histogram(
+    "employeah_db_statement_duration_seconds",
+    "SQL statement execution time (cursor execute to completion).",
+    ["engine", "operation"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+
+def _operation(statement: str) -> str:
+    head = statement.lstrip().split(None, 1)
+    return head[0].upper() if head else "UNKNOWN"
+
+
+def instrument_engine(sync_engine, name: str) -> None:
+    """Time every cursor execution on `sync_engine` (use .sync_engine for async engines)."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("_query_start")
+        if not starts:
+            return
+        DB_STATEMENT_DURATION.labels(name, _operation(statement)).observe(time.perf_counter() - starts.pop())
+
+
+class _StatsCollector:
+    """Exports report cache and connection pool counters at scrape time."""
+
+    def collect(self):
+        hits = CounterMetricFamily("employeah_report_cache_hits", "Report cache hits.")
+        hits.add_metric([], report_cache.hits)
+        misses = CounterMetricFamily("employeah_report_cache_misses", "Report cache misses.")
+        misses.add_metric([], report_cache.misses)
+        entries = GaugeMetricFamily("employeah_report_cache_entries", "Entries currently cached.")
+        entries.add_metric([], len(report_cache))
+        yield from (hits, misses, entries)
+
+        pools = pool_stats()
+        gauges = {
+            "checked_out": "Connections currently checked out.",
+            "checked_in": "Idle connections in the pool.",
+            "overflow": "Overflow connections currently open.",
+        }
+        for key, doc in gauges.items():
+            g = GaugeMetricFamily(f"employeah_db_pool_{key}", doc, labels=["engine"])
+            for engine_name, stats in pools.items():
+                g.add_metric([engine_name], stats[key])
+            yield g
+        counters = {
+            "checkouts": "Connection checkouts.",
+            "waits": "Checkouts slower than 1 ms.",
+            "wait_seconds": "Total time spent in slow checkouts.",
+            "timeouts": "Checkouts that timed out.",
+        }
+        for key, doc in counters.items():
+            c = CounterMetricFamily(f"employeah_db_pool_{key}", doc, labels=["engine"])
+            for engine_name, stats in pools.items():
+                c.add_metric([engine_name], stats[key])
+            yield c
+
+
+def register_stats_collector() -> None:
+    REGISTRY.register(_StatsCollector())
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording per-route latency and in-flight requests."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            # route template (set by the router on the shared scope) keeps label cardinality bounded
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            HTTP_REQUEST_DURATION.labels(method, route_path, str(status)).observe(time.perf_counter() - start)
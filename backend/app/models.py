@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 
 from sqlalchemy import (
+    BigInteger,
+    Date,
     DateTime,
+    Index,
     ForeignKey,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -169,3 +173,68 @@ class UniversityCourse(Base):
 
     university_id: Mapped[int] = mapped_column(ForeignKey("university.id"), primary_key=True)
     course_id: Mapped[int] = mapped_column(ForeignKey("course.id"), primary_key=True)
+
+
+# Expression indexes for the case-insensitive filters used by the API
+# (func.lower(...) == / .in_() / .contains()); see migration 20261017_02.
+Index("ix_job_title_lower", func.lower(Job.title))
+Index("ix_skill_name_lower", func.lower(Skill.name))
+Index(
+    "ix_skill_name_lower_trgm",
+    func.lower(Skill.name).label("name_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"name_lower": "gin_trgm_ops"},
+)
+Index(
+    "ix_location_city_lower_trgm",
+    func.lower(Location.city).label("city_lower"),
+    postgresql_using="gin",
+    postgresql_ops={"city_lower": "gin_trgm_ops"},
+)
+
+
+class SkillTrendMonthly(Base):
+    """Job counts per month x title x city x skill, maintained by app.rollups.
+
+    Rows with an empty ``skill_key`` hold the total number of jobs for the
+    month/title cell; the other rows hold the jobs mentioning that skill.
+    ``city_key`` is always ``'*'`` (app.rollups.ALL_CITIES): location-filtered
+    trends are counted from the base tables, since a job can have several cities.
+    """
+
+    __tablename__ = "skill_trend_monthly"
+    __table_args__ = (Index("ix_skill_trend_monthly_skill_month", "skill_key", "month"),)
+
+    month: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    title_key: Mapped[str] = mapped_column(String(500), primary_key=True)
+    city_key: Mapped[str] = mapped_column(String(100), primary_key=True)
+    skill_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    job_count: Mapped[int] = mapped_column(Integer)
+
+
+class IngestRow(Base):
+    """Content hash of every pipeline row already loaded by app.ingest_jobs."""
+
+    __tablename__ = "ingest_row"
+
+    row_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    job_id: Mapped[int] = mapped_column(ForeignKey("job.id", ondelete="CASCADE"), index=True)
+
+
+class IngestWatermark(Base):
+    """Latest job date loaded per pipeline source (the CSV "Website" column)."""
+
+    __tablename__ = "ingest_watermark"
+
+    source: Mapped[str] = mapped_column(String(255), primary_key=True)
+    max_date: Mapped[date] = mapped_column(Date)
+    loaded_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class ReportDataVersion(Base):
+    """Single-row counter bumped by every job data load; part of the report cache keys (app.cache)."""
+
+    __tablename__ = "report_data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger)
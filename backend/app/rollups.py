@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable
+from datetime import datetime
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from app.db import SessionLocal
+
+
+# city_key of every rollup row: jobs are counted regardless of their locations.
+# A job can have several cities, so location-filtered trends are counted from
+# the base tables instead (see app.api.reports.report_skill_trend).
+ALL_CITIES = "*"
+
+# One row per job with its month bucket, fanned out into a skill-less "total"
+# row and one row per lowercased skill name.
+_ROLLUP_SELECT = """
+    WITH jm AS (
+        SELECT j.id, date_trunc('month', j.date) AS month, lower(j.title) AS title_key, '*' AS city_key
+        FROM job j
+        WHERE j.date IS NOT NULL {month_filter}
+    )
+    SELECT month, title_key, city_key, '' AS skill_key, count(*) AS job_count
+    FROM jm
+    GROUP BY month, title_key, city_key
+    UNION ALL
+    SELECT jm.month, jm.title_key, jm.city_key, lower(s.name), count(DISTINCT jm.id)
+    FROM jm
+    JOIN job_skills js ON js.job_id = jm.id
+    JOIN skill s ON s.id = js.skill_id
+    GROUP BY jm.month, jm.title_key, jm.city_key, lower(s.name)
+"""
+
+_INSERT = "INSERT INTO skill_trend_monthly (month, title_key, city_key, skill_key, job_count) "
+
+
+def months_for_jobs(db: Session, job_ids: Iterable[int]) -> set[datetime]:
+    """Return the month buckets currently occupied by the given jobs."""
+    ids = [int(i) for i in job_ids]
+    if not ids:
+        return set()
+    stmt = text(
+        "SELECT DISTINCT date_trunc('month', date) FROM job WHERE date IS NOT NULL AND id IN :ids"
+    ).bindparams(bindparam("ids", expanding=True))
+    return {r[0] for r in db.execute(stmt, {"ids": ids}).all()}
+
+
+def refresh_skill_trend(db: Session, months: Iterable[datetime] | None = None) -> None:
+    """Recompute skill_trend_monthly for the given months, or entirely if months is None.
+
+    Runs inside the caller's transaction; the caller commits.
+    """
+    if months is None:
+        db.execute(text("DELETE FROM skill_trend_monthly"))
+        db.execute(text(_INSERT + _ROLLUP_SELECT.format(month_filter="")))
+        return
+
+    month_list = sorted(set(months))
+    if not month_list:
+        return
+
+    delete_stmt = text("DELETE FROM skill_trend_monthly WHERE month IN :months").bindparams(
+        bindparam("months", expanding=True)
+    )
+    insert_stmt = text(
+        _INSERT + _ROLLUP_SELECT.format(month_filter="AND date_trunc('month', j.date) IN :months")
+    ).bindparams(bindparam("months", expanding=True))
+
+    db.execute(delete_stmt, {"months": month_list})
+    db.execute(insert_stmt, {"months": month_list})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rebuild the skill_trend_monthly rollup table.")
+    parser.parse_args()
+
+    with SessionLocal() as db:
+        refresh_skill_trend(db)
+        db.commit()
+
+
+if __name__ == "__main__":
+    main()
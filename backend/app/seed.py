@@ -9,8 +9,11 @@ from pathlib import Path
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.bulk_load import JobRecord, bulk_load_jobs
+from app.cache import bump_report_data_version
 from app.db import SessionLocal
 from app.models import Company, Course, Job, Location, Skill
+from app.rollups import months_for_jobs, refresh_skill_trend
 
 
 SEED_PATH_DEFAULT = Path(__file__).parent / "seed_data" / "mock_data.json"
@@ -138,6 +141,22 @@ def upsert_job(db: Session, cache: Cache, item: dict) -> Job:
     return obj
 
 
+def job_record(item: dict) -> JobRecord:
+    job_id = item.get("id")
+    if job_id is None:
+        raise ValueError("Bulk mode requires job ids")
+    return JobRecord(
+        id=int(job_id),
+        title=item.get("title"),
+        date=_parse_date(item.get("date_posted")),
+        salary=item.get("salary"),
+        description=item.get("description"),
+        company=item.get("company"),
+        city=item.get("location"),
+        skills=[str(s) for s in (item.get("skills") or [])],
+    )
+
+
 def reset_db(db: Session) -> None:
     db.execute(
         text(
@@ -155,14 +174,17 @@ def reset_db(db: Session) -> None:
               skill,
               location,
               field,
-              university
+              university,
+              skill_trend_monthly,
+              ingest_row,
+              ingest_watermark
             RESTART IDENTITY CASCADE;
             """
         )
     )
 
 
-def seed(seed_path: Path, reset: bool) -> None:
+def seed(seed_path: Path, reset: bool, bulk: bool = False) -> None:
     raw = json.loads(seed_path.read_text(encoding="utf-8"))
     jobs = raw.get("jobs") or []
     courses = raw.get("courses") or []
@@ -170,6 +192,7 @@ def seed(seed_path: Path, reset: bool) -> None:
     with SessionLocal() as db:
         if reset:
             reset_db(db)
+            bump_report_data_version(db)
             db.commit()
 
         cache = Cache(companies={}, locations={}, skills={}, courses={})
@@ -181,9 +204,23 @@ def seed(seed_path: Path, reset: bool) -> None:
             course = get_or_create_course(db, cache, title=title, semester=c.get("semester"), url=c.get("url"))
             course.skills = [get_or_create_skill(db, cache, s) for s in (c.get("skills") or []) if str(s).strip()]
 
-        for j in jobs:
-            upsert_job(db, cache, j)
+        # months touched before the load, so jobs whose date moved don't leave stale buckets
+        seeded_ids = [int(j["id"]) for j in jobs if j.get("id") is not None]
+        stale_months = set() if reset else months_for_jobs(db, seeded_ids)
+
+        if bulk:
+            db.flush()
+            loaded_ids = bulk_load_jobs(db, [job_record(j) for j in jobs])
+        else:
+            loaded_ids = [upsert_job(db, cache, j).id for j in jobs]
+            db.flush()
+
+        if reset:
+            refresh_skill_trend(db)
+        else:
+            refresh_skill_trend(db, stale_months | months_for_jobs(db, loaded_ids))
 
+        bump_report_data_version(db)
         db.commit()
 
         db.execute(text("SELECT setval('job_id_seq', COALESCE((SELECT MAX(id) FROM job), 1), true);"))
@@ -194,13 +231,14 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Seed Postgres with frontend mock data.")
     parser.add_argument("--path", type=str, default=str(SEED_PATH_DEFAULT), help="Path to mock_data.json")
     parser.add_argument("--reset", action="store_true", help="Wipe DB tables before seeding")
+    parser.add_argument("--bulk", action="store_true", help="Load jobs via COPY into staging tables (faster for large files)")
     args = parser.parse_args()
 
     seed_path = Path(args.path)
     if not seed_path.exists():
         raise FileNotFoundError(f"Seed file not found: {seed_path}. Run scripts/export_mock_data.mjs first.")
 
-    seed(seed_path=seed_path, reset=args.reset)
+    seed(seed_path=seed_path, reset=args.reset, bulk=args.bulk)
 
 
 if __name__ == "__main__":
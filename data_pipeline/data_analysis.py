@@ -3,10 +3,11 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import os
 
+from job_store import DATASET_DIR, read_jobs
+
 # --- GLOBAL CONFIG ---
 DATA_DIR = 'database/data/job_data'
 STATS_DIR = os.path.join(DATA_DIR, 'statistics')
-MERGED_FILE = os.path.join(DATA_DIR, "ALL_JOB_DATA.csv")
 
 def analyze_job_data(source_name):
     """
@@ -15,17 +16,16 @@ def analyze_job_data(source_name):
     """
     SOURCE_OUTPUT_DIR = os.path.join(STATS_DIR, source_name)
     os.makedirs(SOURCE_OUTPUT_DIR, exist_ok=True)
-    INPUT_FILE = os.path.join(DATA_DIR, f'{source_name}_jobs.csv')
     
     print(f"\n=======================================================")
     print(f"📊 STARTING ANALYSIS FOR: {source_name.upper()}")
     print(f"=======================================================")
-    print(f"📂 Loading data from {INPUT_FILE}...")
+    print(f"📂 Loading data from {DATASET_DIR}...")
 
-    try:
-        df = pd.read_csv(INPUT_FILE)
-    except FileNotFoundError:
-        print(f"❌ Error: Could not find {INPUT_FILE}")
+    # Only the plotted columns of this source's partitions are read
+    df = read_jobs(columns=['Company', 'City', 'Job Title', 'Date'], filters=[('Website', '=', source_name)])
+    if df.empty:
+        print(f"❌ Error: No {source_name} jobs in {DATASET_DIR}")
         return
 
     # Ensure Date column is datetime
@@ -104,33 +104,28 @@ def analyze_job_data(source_name):
 
 def generate_overall_analysis():
     """
-    Loads the pre-merged ALL_JOB_DATA.csv and generates aggregate statistics.
+    Loads all sources from the job store and generates aggregate statistics.
     Saves to 'statistics/overall'.
     """
     OVERALL_OUTPUT_DIR = os.path.join(STATS_DIR, 'overall')
     os.makedirs(OVERALL_OUTPUT_DIR, exist_ok=True)
 
     print(f"\n=======================================================")
-    print(f"📊 GENERATING OVERALL ANALYSIS (FROM MERGED FILE)")
+    print(f"📊 GENERATING OVERALL ANALYSIS (FROM JOB STORE)")
     print(f"=======================================================")
-    
-    if not os.path.exists(MERGED_FILE):
-        print(f"❌ Error: Could not find {MERGED_FILE}. Please run your merge script first.")
-        return
 
-    try:
-        master_df = pd.read_csv(MERGED_FILE)
-    except Exception as e:
-        print(f"❌ Error reading merged file: {e}")
+    master_df = read_jobs(columns=['Website', 'Company', 'City', 'Job Title'])
+    if master_df.empty:
+        print(f"❌ Error: No jobs in {DATASET_DIR}. Please run the scheduler first.")
         return
 
-    print(f"✅ Loaded {len(master_df)} total jobs from merged file.")
+    print(f"✅ Loaded {len(master_df)} total jobs from job store.")
     plt.style.use('ggplot')
 
     # PLOT 1: Source Comparison
-    id_map = {0: 'Arbeitnow', 1: 'Adzuna', 2: 'HackerNews'}
-    if 'website' in master_df.columns:
-        source_counts = master_df['website'].map(id_map).value_counts()
+    name_map = {'arbeitnow': 'Arbeitnow', 'adzuna': 'Adzuna', 'hackernews': 'HackerNews'}
+    if 'Website' in master_df.columns:
+        source_counts = master_df['Website'].map(lambda w: name_map.get(str(w).lower(), str(w))).value_counts()
         plt.figure(figsize=(10, 6))
         colors = ['#2980b9' if x=='Arbeitnow' else '#27ae60' if x=='Adzuna' else '#FF6600' for x in source_counts.index]
         bars = plt.bar(source_counts.index, source_counts.values, color=colors)
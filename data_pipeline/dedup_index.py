@@ -0,0 +1,90 @@
+import hashlib
+import os
+import sqlite3
+
+from job_store import DATASET_DIR, read_jobs
+
+# On-disk set of hashes of every job already stored, consulted by the scrapers
+# before a row is appended to the DataFrame
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "job_data", "dedup_index.sqlite")
+HASH_COLUMNS = ["Job Title", "Company", "City", "URL", "Description"]
+
+
+def job_hash(row):
+    """
+    Normalized content hash of a job (dict or Series with the HASH_COLUMNS keys)
+    """
+    key = "\x1f".join(" ".join(str(row.get(col) or "").split()).lower() for col in HASH_COLUMNS)
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+class DedupIndex:
+    """
+    SQLite-backed hash set. check() answers from disk and remembers the new hashes
+    of the current run; they are only persisted by commit(), once the jobs are stored,
+    so a failed run does not hide its jobs from the next one.
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (hash BLOB PRIMARY KEY) WITHOUT ROWID")
+        self.pending = set()
+
+    def __len__(self):
+        return self.conn.execute("SELECT count(*) FROM seen").fetchone()[0]
+
+    def __contains__(self, h):
+        return h in self.pending or self.conn.execute("SELECT 1 FROM seen WHERE hash = ?", (h,)).fetchone() is not None
+
+    def check(self, row):
+        """
+        True if the job is new (and marks it as seen for this run), False if it is a duplicate
+        """
+        h = job_hash(row)
+        if h in self:
+            return False
+        self.pending.add(h)
+        return True
+
+    def add_many(self, hashes):
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO seen (hash) VALUES (?)", ((h,) for h in hashes))
+
+    def commit(self):
+        self.add_many(self.pending)
+        self.pending.clear()
+
+    def rollback(self):
+        self.pending.clear()
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def build_from_store(index, dataset_dir=DATASET_DIR):
+    """
+    Fill the index with every job already in the Parquet store, one website partition at a time
+    """
+    websites = read_jobs(dataset_dir, columns=["Website"])["Website"].unique()
+    for website in websites:
+        jobs = read_jobs(dataset_dir, columns=HASH_COLUMNS, filters=[("Website", "=", website)])
+        index.add_many(job_hash(row) for row in jobs.to_dict("records"))
+        print(f"Indexed {len(jobs)} {website} jobs")
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="(Re)build the scraper dedup index from the Parquet job store")
+    parser.add_argument("--dataset-dir", default=DATASET_DIR)
+    parser.add_argument("--index-path", default=INDEX_PATH)
+    args = parser.parse_args()
+    with DedupIndex(args.index_path) as index:
+        build_from_store(index, args.dataset_dir)
+        print(f"{len(index)} hashes in {args.index_path}")
@@ -0,0 +1,77 @@
+"""
+Benchmark extract_from_title against the previous one-title-at-a-time loop on CPU.
+
+Run from data_pipeline/:
+    python -m extraction.bench_extract_title --titles 100000
+The old loop is timed on --reference-sample titles and extrapolated, since a
+100k run of it takes hours on CPU.
+"""
+import argparse
+import random
+import time
+import pandas as pd
+from pathlib import Path
+from sentence_transformers import util
+
+from extraction.extraction import extract_from_title, extract_level, clean_job_title
+from data_processing.model_registry import get_sentence_model
+
+FIELD_PATH = Path(__file__).parent / "lists" / "fields.txt"
+
+
+def synthetic_titles(n, seed=0):
+    rnd = random.Random(seed)
+    variants = [p.strip() for line in open(FIELD_PATH, encoding="utf-8") for p in line.split(";") if p.strip()]
+    prefixes = ["", "Senior ", "Junior ", "Lead ", "Werkstudent ", "Staff ", "Intern "]
+    suffixes = ["", " (m/w/d)", " Engineer", " Manager", " / Remote", " - Berlin", " II"]
+    # realistic skew: a few thousand distinct titles repeated many times
+    pool = [rnd.choice(prefixes) + rnd.choice(variants) + rnd.choice(suffixes) for _ in range(max(1, n // 20))]
+    return [rnd.choice(pool) for _ in range(n)]
+
+
+def reference_fields(titles, model, field_variants, variant_to_canonical, treshold):
+    variant_embeddings = model.encode(field_variants, convert_to_tensor=True)
+    out = []
+    for job_title in titles:
+        level = extract_level(job_title)
+        t_emb = model.encode(clean_job_title(job_title), convert_to_tensor=True)
+        scores = util.cos_sim(t_emb, variant_embeddings)[0]
+        best_idx = scores.argmax().item()
+        field = variant_to_canonical[field_variants[best_idx]] if scores[best_idx].item() > treshold else "Other"
+        out.append((field, int(level)))
+    return out
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched title field extraction")
+    parser.add_argument("--titles", type=int, default=100_000)
+    parser.add_argument("--reference-sample", type=int, default=2_000)
+    parser.add_argument("--model", default="TechWolf/JobBERT-v2")
+    parser.add_argument("--treshold", type=float, default=0.3)
+    args = parser.parse_args()
+
+    titles = synthetic_titles(args.titles)
+    df = pd.DataFrame({"Job Title": titles})
+
+    start = time.perf_counter()
+    df = extract_from_title(df, FIELD_PATH, treshold=args.treshold, model_name=args.model)
+    batched = time.perf_counter() - start
+
+    field_variants, variant_to_canonical = [], {}
+    for line in open(FIELD_PATH, encoding="utf-8"):
+        parts = [p.strip() for p in line.split(";") if p.strip()]
+        for p in parts:
+            field_variants.append(p)
+            variant_to_canonical[p] = parts[0]
+    model = get_sentence_model(args.model)
+    sample = titles[:args.reference_sample]
+    start = time.perf_counter()
+    expected = reference_fields(sample, model, field_variants, variant_to_canonical, args.treshold)
+    per_title = (time.perf_counter() - start) / len(sample)
+
+    got = list(zip(df["Field"][:len(sample)], df["Level"][:len(sample)]))
+    agree = sum(e == g for e, g in zip(expected, got)) / len(sample)
+    print(f"batched   {args.titles} titles ({df['Job Title'].nunique()} distinct) in {batched:8.1f} s")
+    print(f"per-title {per_title * 1000:.1f} ms/title -> {per_title * args.titles:8.1f} s for {args.titles} titles "
+          f"({per_title * args.titles / batched:.0f}x)")
+    print(f"agreement with per-title loop on {len(sample)} titles: {agree:.2%}")
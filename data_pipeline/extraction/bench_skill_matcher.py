@@ -0,0 +1,74 @@
+"""
+Benchmark the trie SkillMatcher against the alternation regex it replaces, over the job
+corpus, and check both extract the same Skills for every description.
+
+Run from data_pipeline/:
+    python -m extraction.bench_skill_matcher
+    python -m extraction.bench_skill_matcher --csv old_code/old_data/adzuna_jobs.csv.gz --limit 5000
+    python -m extraction.bench_skill_matcher --skip-regex --workers 8
+"""
+import argparse
+import re
+import sys
+import time
+import pandas as pd
+from pathlib import Path
+
+from job_store import read_jobs
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from data_processing.skill_matcher import SkillMatcher, extract_skills, read_skill_list
+
+SKILL_PATH = Path(__file__).parent / "lists" / "all_skills.txt"
+
+
+def regex_extract(descriptions, skills):
+    sorted_skills = sorted(skills, key=len, reverse=True)
+    regex = r"\b(?:" + "|".join(re.escape(s) for s in sorted_skills) + r")\b"
+    pattern = re.compile(regex, re.IGNORECASE)
+    return [sorted({m.title() for m in pattern.findall(d)}) for d in descriptions]
+
+
+def matcher_extract(descriptions, skills):
+    matcher = SkillMatcher(skills)
+    return [matcher.extract(d) for d in descriptions]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark skill extraction: alternation regex vs trie matcher")
+    parser.add_argument("--skills", default=str(SKILL_PATH))
+    parser.add_argument("--csv", help="Read descriptions from this CSV instead of the job store")
+    parser.add_argument("--limit", type=int, help="Only use the first N descriptions")
+    parser.add_argument("--workers", type=int, default=1, help="Also time extract_skills with this many processes")
+    parser.add_argument("--skip-regex", action="store_true", help="Skip the slow regex baseline")
+    args = parser.parse_args()
+
+    if args.csv:
+        df = pd.read_csv(args.csv, usecols=lambda c: c.lower() == "description")
+        descriptions = df.iloc[:, 0]
+    else:
+        descriptions = read_jobs(columns=["Description"])["Description"]
+    descriptions = descriptions.dropna().astype(str).tolist()[:args.limit]
+    skills = read_skill_list(args.skills)
+    print(f"{len(descriptions)} descriptions, {len(skills)} skills")
+
+    variants = [("matcher", matcher_extract)]
+    if not args.skip_regex:
+        variants.insert(0, ("regex", regex_extract))
+    if args.workers > 1:
+        variants.append((f"{args.workers} procs", lambda d, s: extract_skills(d, s, workers=args.workers)))
+
+    timings = {}
+    results = {}
+    for name, fn in variants:
+        start = time.perf_counter()
+        results[name] = fn(descriptions, skills)
+        timings[name] = time.perf_counter() - start
+        print(f"{name:>8}: {timings[name]:8.2f} s")
+
+    baseline = variants[0][0]
+    for name, _ in variants[1:]:
+        mismatches = [i for i, (a, b) in enumerate(zip(results[baseline], results[name])) if a != b]
+        print(f"{name} vs {baseline}: speedup {timings[baseline] / timings[name]:.1f}x, "
+              f"{len(mismatches)} mismatching descriptions")
+        for i in mismatches[:5]:
+            print(f"  #{i}: {baseline} {results[baseline][i]} {name} {results[name][i]}")
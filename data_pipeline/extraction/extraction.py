@@ -1,47 +1,28 @@
 import re
 import sys 
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from sentence_transformers import SentenceTransformer, util
-from tqdm import tqdm
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from data_processing.llm_with_chunking import search_for_skills, search_for_skills_batch
+from data_processing.embedding_cache import cached_encode
+from data_processing.model_registry import canonical_model_name, get_sentence_model
+from data_processing.skill_matcher import extract_skills, read_skill_list
 
+# Titles scored against the field variants per matrix product
+SCORE_BLOCK = 8192
 
-def extract_from_description(df, skill_path, batch_embedding = False):
+
+def extract_from_description(df, skill_path, batch_embedding = False, workers=1):
     """
-    Extract skills from job description with regex and adds them as in list in Skills colums
+    Extract skills from job description with regex and adds them as in list in Skills colums.
+    workers > 1 (None = all cores) matches chunks of descriptions in a process pool.
     """
-    df["Skills"] = pd.Series([None] * len(df), dtype=object)
-
-    known_skills = []
-    categories = []
-    skills = []
+    known_skills = read_skill_list(skill_path)
 
-    with open(skill_path, "r", encoding="utf-8") as f:
-        for line in f:
-            clean_line = line.strip()
-            if clean_line:
-                if clean_line.endswith(':'):
-                    # It's a category (remove the colon)
-                    categories.append(clean_line[:-1])
-                elif clean_line.startswith('-'):
-                    # It's a skill (remove the dash)
-                    skills.append(clean_line[1:].strip())
-                else:
-                    # Some other text, add as is
-                    skills.append(clean_line)
-    known_skills = skills + categories
-
-    sorted_skills = sorted(known_skills, key=len, reverse=True)
-    regex = r"\b(?:" + "|".join(re.escape(s) for s in sorted_skills) + r")\b"
-    pattern = re.compile(regex, re.IGNORECASE)
-    
-    # Mathc knwon skills with job descrition
-    for idx, description in tqdm(enumerate(df["Description"]),total=len(df),desc="Extracting skills "):
-        matches = pattern.findall(str(description))
-        unique_skills = sorted({m.title() for m in matches})
-        df.at[idx, "Skills"] = unique_skills  
+    # Mathc knwon skills with job descrition, then set the whole column at once
+    skills = extract_skills(df["Description"], known_skills, workers=workers)
+    df["Skills"] = pd.Series(skills, index=df.index, dtype=object)
 
     print("SKILLS WITH REGEX EXTRACTED SUCCESFULLY \n")
     if batch_embedding:
@@ -52,15 +33,12 @@ def extract_from_description(df, skill_path, batch_embedding = False):
     return df
 
 
-def extract_from_title(df, field_path, treshold=0.50, model_name="intfloat/multilingual-e5-large"):
+def extract_from_title(df, field_path, treshold=0.50, model_name="intfloat/multilingual-e5-large", batch_size=256):
     """
     Extract level and field from a job title and adds it to the dataframe
     Level extraction with regex
     Field extraction with embedding similarity
     """
-    df["Field"] = df.get("Field", pd.Series("", index=df.index)).astype("string")
-    df["Level"] = df.get("Level", pd.Series(1, dtype=int))  
-
     # Load fields.txt file 
     canonical_fields = []
     field_variants = []
@@ -78,29 +56,37 @@ def extract_from_title(df, field_path, treshold=0.50, model_name="intfloat/multi
                 variant_to_canonical[p] = canonical
 
     # Load model + Embed fields 
-    model = SentenceTransformer(model_name)
-    variant_embeddings = model.encode(field_variants, convert_to_tensor=True) 
-
-    # Extract most similar job field from titles and seniority level:
-    for idx, job_title in tqdm(df["Job Title"].items(), total=len(df), desc="Processing job titles"):
-
-        level = extract_level(job_title)
-        cleaned_title = clean_job_title(job_title)
-        t_emb = model.encode(cleaned_title, convert_to_tensor=True)
-        scores = util.cos_sim(t_emb, variant_embeddings)[0]
-
-        best_idx = scores.argmax().item()
-        best_score = scores[best_idx].item()
-
-        best_variant = field_variants[best_idx]
-
-        if best_score > treshold:
-            field = variant_to_canonical[best_variant]
-        else:
-            field = "Other"
-
-        df.loc[idx, "Field"] = field
-        df.loc[idx, "Level"] = int(level)
+    model = get_sentence_model(model_name)
+    cache_name = canonical_model_name(model_name)
+    variant_embeddings = cached_encode(model, field_variants, normalize_embeddings=True, model_name=cache_name)
+
+    # Titles repeat a lot, so each distinct title is handled once
+    titles = df["Job Title"]
+    unique_titles = pd.unique(titles)
+    levels = {title: int(extract_level(title)) for title in unique_titles}
+    cleaned = {title: clean_job_title(title) for title in unique_titles}
+
+    # Embed distinct cleaned titles in large batches and score them with one matrix product per block
+    unique_cleaned = list(dict.fromkeys(cleaned.values()))
+    title_embeddings = cached_encode(model, unique_cleaned, normalize_embeddings=True, batch_size=batch_size,
+                                     model_name=cache_name, show_progress_bar=True)
+    best_scores = []
+    best_idxs = []
+    for start in range(0, len(unique_cleaned), SCORE_BLOCK):
+        # normalized embeddings: dot product == cosine similarity
+        scores = title_embeddings[start:start + SCORE_BLOCK] @ variant_embeddings.T
+        block_idxs = scores.argmax(axis=1)
+        best_scores.extend(scores[np.arange(len(block_idxs)), block_idxs].tolist())
+        best_idxs.extend(block_idxs.tolist())
+
+    field_by_cleaned = {
+        text: variant_to_canonical[field_variants[best_idx]] if best_score > treshold else "Other"
+        for text, best_score, best_idx in zip(unique_cleaned, best_scores, best_idxs)
+    }
+
+    # Write field and seniority level back as whole columns
+    df["Field"] = titles.map(lambda t: field_by_cleaned[cleaned[t]]).astype("string")
+    df["Level"] = titles.map(levels).astype(int)
 
     print("FIELDS AND LEVELS EXTRACTED SUCCESSFULLY \n")
     return df
@@ -144,13 +130,14 @@ def extract_level(title):
 if __name__ == "__main__":
     #If this is the main file, run extraction on the full parquet
     # Get skills from df
-    csv_path = Path(__file__).parent.parent / "data" / "job_data" / "ALL_JOBS.csv.gz"
+    sys.path.append(str(Path(__file__).parent.parent))
+    from job_store import DATASET_DIR, read_jobs, write_jobs
     #skill_path = "./extraction/lists/skill_areas_flattened.txt"
     skill_path = Path(__file__).parent / "lists" / "skill_areas_flattened.txt"
-    print("Loading ZIP file...")
-    df = pd.read_csv(csv_path)
+    print("Loading job store...")
+    df = read_jobs(DATASET_DIR)
     #Computing the skills for the whole dataset can take to much RAM, so we process it in chunks of 10000 rows
-    df = extract_from_description(df, skill_path, batch_embedding=True)
+    df = extract_from_description(df, skill_path, batch_embedding=True, workers=None)
 
     # Get fields from df
     #field_path = "./extraction/lists/fields.txt"
@@ -158,6 +145,6 @@ if __name__ == "__main__":
     model_name = "TechWolf/JobBERT-v2" 
     df = extract_from_title(df,field_path,treshold=0.3,model_name=model_name)
 
-    # Save back to parquet
-    df.to_parquet(csv_path, compression='snappy', index=False)
-    print(f"Saved extracted DataFrame back to {csv_path}")
+    # Save back to the partitioned dataset (rewrites the partitions present in df)
+    write_jobs(df.drop(columns=["embedded_skills"], errors="ignore"), DATASET_DIR)
+    print(f"Saved extracted DataFrame back to {DATASET_DIR}")
@@ -0,0 +1,156 @@
+import ast
+import os
+import uuid
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+# Hive-partitioned Parquet dataset: <root>/Website=<source>/Date=<YYYY-MM-DD>/part-*.parquet
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "job_data", "ALL_JOBS_parquet")
+PARTITION_COLUMNS = ["Website", "Date"]
+COLUMNS = ["Job Title", "Field", "Level", "Continent", "Country", "City", "Date", "Company", "Description", "URL", "Skills", "Website"]
+DEDUP_COLUMNS = ["Job Title", "Continent", "Country", "City", "Date", "Company", "Description", "URL"]
+
+_PARTITIONING = ds.partitioning(pa.schema([("Website", pa.string()), ("Date", pa.string())]), flavor="hive")
+
+# Fixed schema for writing and reading, so a batch whose Skills are all empty is not
+# inferred as list<null> and later batches can still be read together with it
+JOB_SCHEMA = pa.schema([
+    ("Job Title", pa.string()),
+    ("Field", pa.string()),
+    ("Level", pa.int64()),
+    ("Continent", pa.string()),
+    ("Country", pa.string()),
+    ("City", pa.string()),
+    ("Date", pa.string()),
+    ("Company", pa.string()),
+    ("Description", pa.string()),
+    ("URL", pa.string()),
+    ("Skills", pa.list_(pa.string())),
+    ("Website", pa.string()),
+])
+
+
+def _normalize(df):
+    """
+    Bring a scraped/extracted DataFrame to the stored layout (string partition keys, list Skills)
+    """
+    df = df.copy()
+    for col in COLUMNS:
+        if col not in df.columns:
+            df[col] = None
+    df = df[COLUMNS]
+    df["Website"] = df["Website"].fillna("unknown").astype(str)
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce").dt.strftime("%Y-%m-%d").fillna("unknown")
+    df["Skills"] = df["Skills"].apply(_parse_skills)
+    df["Level"] = pd.to_numeric(df["Level"], errors="coerce").astype("Int64")
+    for col in ["Job Title", "Field", "Continent", "Country", "City", "Company", "Description", "URL"]:
+        df[col] = df[col].astype("string")
+    return df
+
+
+def read_jobs(dataset_dir=DATASET_DIR, columns=None, filters=None):
+    """
+    Read jobs from the dataset. Only the requested columns are read and filters on
+    Website/Date skip whole partitions, e.g. filters=[("Website", "=", "adzuna")]
+    """
+    if not os.path.isdir(dataset_dir) or not any(os.scandir(dataset_dir)):
+        return JOB_SCHEMA.empty_table().select(columns or COLUMNS).to_pandas()
+    dataset = ds.dataset(dataset_dir, format="parquet", partitioning=_PARTITIONING, schema=JOB_SCHEMA)
+    expr = None
+    for col, op, value in filters or []:
+        field = ds.field(col)
+        term = {
+            "=": field == value,
+            "!=": field != value,
+            "<": field < value,
+            "<=": field <= value,
+            ">": field > value,
+            ">=": field >= value,
+            "in": field.isin(value),
+        }[op]
+        expr = term if expr is None else expr & term
+    table = dataset.to_table(columns=columns, filter=expr)
+    return table.to_pandas()
+
+
+def append_jobs(new_jobs_df, dataset_dir=DATASET_DIR, dedup_columns=DEDUP_COLUMNS):
+    """
+    Append new jobs, skipping rows already stored. Only the partitions the new rows
+    fall into are read (dedup columns only), so cost does not grow with history.
+    Returns the number of rows written.
+    """
+    if new_jobs_df.empty:
+        return 0
+    new_jobs_df = _normalize(new_jobs_df).drop_duplicates(subset=dedup_columns)
+
+    keys = new_jobs_df[PARTITION_COLUMNS].drop_duplicates()
+    existing = []
+    for website, group in keys.groupby("Website"):
+        existing.append(read_jobs(
+            dataset_dir,
+            columns=dedup_columns,
+            filters=[("Website", "=", website), ("Date", "in", group["Date"].tolist())],
+        ))
+    existing = [e for e in existing if not e.empty]
+    if existing:
+        seen = pd.concat(existing, ignore_index=True).astype("string").drop_duplicates()
+        marker = new_jobs_df[dedup_columns].astype("string").merge(seen, how="left", indicator=True)["_merge"]
+        new_jobs_df = new_jobs_df[(marker == "left_only").to_numpy()]
+
+    if new_jobs_df.empty:
+        return 0
+    _write(new_jobs_df, dataset_dir, existing_data_behavior="overwrite_or_ignore")
+    return len(new_jobs_df)
+
+
+def write_jobs(df, dataset_dir=DATASET_DIR):
+    """
+    Replace the partitions present in df with its rows (e.g. after re-running extraction)
+    """
+    _write(_normalize(df), dataset_dir, existing_data_behavior="delete_matching")
+
+
+def _write(df, dataset_dir, existing_data_behavior):
+    table = pa.Table.from_pandas(df, schema=JOB_SCHEMA, preserve_index=False)
+    ds.write_dataset(
+        table,
+        dataset_dir,
+        format="parquet",
+        partitioning=_PARTITIONING,
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior=existing_data_behavior,
+    )
+
+
+def migrate_csv(csv_path, dataset_dir=DATASET_DIR):
+    """
+    One-off conversion of the old ALL_JOBS.csv.gz into the partitioned dataset
+    """
+    df = pd.read_csv(csv_path, compression="infer")
+    df["Skills"] = df["Skills"].apply(_parse_skills)
+    write_jobs(df, dataset_dir)
+    print(f"Migrated {len(df)} rows from {os.path.basename(csv_path)} to {dataset_dir}")
+
+
+def _parse_skills(value):
+    if isinstance(value, (list, tuple)) or hasattr(value, "tolist"):
+        return [str(s) for s in list(value)]
+    if not isinstance(value, str) or not value.strip():
+        return []
+    value = value.strip()
+    if value.startswith("["):
+        try:
+            return [str(s) for s in ast.literal_eval(value)]
+        except (ValueError, SyntaxError):
+            value = value.strip("[]")
+    return [s.strip().strip("'\"") for s in value.split(",") if s.strip()]
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Convert ALL_JOBS.csv.gz into the partitioned Parquet job store")
+    parser.add_argument("csv_path")
+    parser.add_argument("--dataset-dir", default=DATASET_DIR)
+    args = parser.parse_args()
+    migrate_csv(args.csv_path, args.dataset_dir)
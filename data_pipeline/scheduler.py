@@ -2,29 +2,40 @@ import pandas as pd
 import os
 from datetime import datetime, timedelta
 
-from scrapers.scrape_jobs.current_jobs.scrape_arbeitnow_jobs import scrape_arbeitnow
-from scrapers.scrape_jobs.current_jobs.scrape_adzuna import scrape_adzuna
+from scrapers.scrape_jobs.current_jobs import JOB_COLUMNS
+from scrapers.scrape_jobs.current_jobs.scrape_arbeitnow_jobs import iter_arbeitnow
+from scrapers.scrape_jobs.current_jobs.scrape_adzuna import iter_adzuna
 from extraction.extraction import extract_from_description
 from extraction.extraction import extract_from_title
+from job_store import DATASET_DIR, append_jobs
+from dedup_index import INDEX_PATH, DedupIndex, build_from_store
+from scrape_checkpoint import CHECKPOINT_PATH, ScrapeCheckpoint
 
 
-def scheduler(dataset_path, max_pages=2, max_old_date=None):
+def scheduler(dataset_path, max_pages=2, max_old_date=None, index_path=INDEX_PATH, checkpoint_path=CHECKPOINT_PATH):
     """
-    Launch all scraper and extrac skills and field and append result to dataset
+    Launch all scraper and extrac skills and field and append result to dataset.
+    Scraped pages are checkpointed, so after a crash the next call resumes the run.
     """
     #######################################
     ## SCRAIPING
     #######################################
     if max_old_date is None:
         max_old_date = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
+    checkpoint = ScrapeCheckpoint(checkpoint_path)
+    max_old_date = checkpoint.start(max_old_date)
     
-    print(f"------ STARTING SCRAPING ------")
-    # Define DataFrame structure
-    columns = ["Job Title", "Field", "Level", "Continent", "Country", "City", "Date", "Company", "Description", "URL", "Skills", "Website"]
-    new_jobs_df = pd.DataFrame(columns=columns)
+    dedup = DedupIndex(index_path)
+    if len(dedup) == 0 and os.path.isdir(dataset_path):
+        print("Building dedup index from dataset")
+        build_from_store(dedup, dataset_path)
 
-    new_jobs_df = scrape_arbeitnow(new_jobs_df, max_old_date, max_pages=None)
-    new_jobs_df = scrape_adzuna(new_jobs_df, max_old_date,max_pages=max_pages)
+    print(f"------ STARTING SCRAPING ------")
+    # Collect plain rows and build the DataFrame once
+    rows = []
+    rows.extend(iter_arbeitnow(max_old_date, max_pages=None, dedup=dedup, checkpoint=checkpoint))
+    rows.extend(iter_adzuna(max_old_date, max_pages=max_pages, dedup=dedup, checkpoint=checkpoint))
+    new_jobs_df = pd.DataFrame.from_records(rows, columns=JOB_COLUMNS)
 
     print("------ SCRAPING COMPLETE ------")
     print()
@@ -40,29 +51,19 @@ def scheduler(dataset_path, max_pages=2, max_old_date=None):
     new_jobs_df = extract_from_title(new_jobs_df,field_path,treshold=0.3,model_name=model_name)
 
     #######################################
-    ## MERGING TABLES
-    #######################################
-    print("------ MERGING TABLES ------")
-    full_dataset = pd.read_csv(dataset_path, compression='gzip')
-    temp = len(full_dataset)
-    full_dataset = pd.concat([full_dataset, new_jobs_df], ignore_index=True)
-    dedup_columns = ["Job Title", "Continent", "Country", "City", "Date", "Company", "Description", "URL"]
-    full_dataset = full_dataset.drop_duplicates(subset=dedup_columns)
-    print(f"New jobs: {len(full_dataset)-temp}")   
-    print()
-
-    #######################################
-    ## ZIP FILE
+    ## APPENDING TO DATASET
     #######################################
-    print("------ SAVING DATASET ------")
-    print(f"Compressing {os.path.basename(dataset_path)}")
-    try:
-        full_dataset.to_csv(dataset_path, index=False, compression='gzip')
-        print(f"Saved: {os.path.basename(dataset_path)}")
-    except Exception as e:
-        print(f"Error compressing {os.path.basename(dataset_path)}: {e}")
+    print("------ APPENDING TO DATASET ------")
+    written = append_jobs(new_jobs_df, dataset_path)
+    # only now are the scraped hashes safe to persist
+    dedup.commit()
+    dedup.close()
+    checkpoint.clear()
+    checkpoint.close()
+    print(f"New jobs: {written}")
+    print(f"Saved to: {os.path.basename(dataset_path)}")
 
 
 if __name__ == "__main__":
-    dataset_path = "./data/job_data/ALL_JOBS.csv.gz"
+    dataset_path = DATASET_DIR
     scheduler(dataset_path)
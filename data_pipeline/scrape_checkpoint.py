@@ -0,0 +1,76 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+# Progress and partial results of the current scheduler run, so a crashed run
+# resumes with the unfinished pages instead of re-scraping everything
+CHECKPOINT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "job_data", "scrape_checkpoint.sqlite")
+
+
+class ScrapeCheckpoint:
+    """
+    SQLite checkpoint store. Scrapers save every fetched page under a unit such as a
+    country/query pair: its rows plus the state needed to continue (next URL, page
+    count, last seen date).
+    """
+
+    def __init__(self, path=CHECKPOINT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        with self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS run (id INTEGER PRIMARY KEY CHECK (id = 1), stop_date TEXT, started_at TEXT);
+                CREATE TABLE IF NOT EXISTS page (
+                    scraper TEXT, unit TEXT, page INTEGER, rows TEXT, state TEXT,
+                    PRIMARY KEY (scraper, unit, page)
+                );
+            """)
+
+    def start(self, stop_date):
+        """
+        Begin a run, or resume the unfinished one. Returns the stop_date of the run,
+        which is the saved one when resuming.
+        """
+        saved = self.conn.execute("SELECT stop_date, started_at FROM run").fetchone()
+        if saved is not None:
+            print(f"Resuming scrape started {saved[1]} (until {saved[0]})")
+            return saved[0]
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO run (id, stop_date, started_at) VALUES (1, ?, ?)",
+                (stop_date, datetime.now().isoformat(timespec="seconds")),
+            )
+        return stop_date
+
+    def pages(self, scraper, unit):
+        """
+        Saved pages of a unit as (page, rows, state), in page order
+        """
+        cur = self.conn.execute(
+            "SELECT page, rows, state FROM page WHERE scraper = ? AND unit = ? ORDER BY page", (scraper, unit)
+        )
+        return [(page, json.loads(rows), json.loads(state)) for page, rows, state in cur]
+
+    def save_page(self, scraper, unit, page, rows, state=None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO page (scraper, unit, page, rows, state) VALUES (?, ?, ?, ?, ?)",
+                (scraper, unit, page, json.dumps(rows), json.dumps(state or {})),
+            )
+
+    def clear(self):
+        """
+        Forget the run once its jobs are stored
+        """
+        with self.conn:
+            self.conn.executescript("DELETE FROM run; DELETE FROM page;")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,15 @@
+import pandas as pd
+
+JOB_COLUMNS = ["Job Title", "Field", "Level", "Continent", "Country", "City", "Date", "Company", "Description", "URL", "Skills", "Website"]
+
+
+def append_rows(df, rows):
+    """
+    Build one DataFrame from the collected rows and append it to df in a single concat
+    """
+    if not rows:
+        return df
+    new = pd.DataFrame.from_records(rows, columns=df.columns if len(df.columns) else JOB_COLUMNS)
+    if df.empty:
+        return new
+    return pd.concat([df, new], ignore_index=True)
@@ -0,0 +1,60 @@
+"""
+Compare the old per-row df.loc[len(df)] appends with collecting rows and building the
+DataFrame once, on synthetic scraper rows.
+
+Run from data_pipeline/:
+    python -m scrapers.scrape_jobs.current_jobs.bench_row_append --sizes 1000 4000 50000
+"""
+import argparse
+import time
+import pandas as pd
+
+from . import JOB_COLUMNS, append_rows
+
+
+def _rows(n):
+    for i in range(n):
+        yield {
+            "Job Title": f"Data Engineer {i % 500}",
+            "Continent": "Europe",
+            "Country": "Germany",
+            "City": f"City {i % 300}",
+            "Date": f"2026-10-{i % 28 + 1:02d}",
+            "Company": f"Company {i % 2000}",
+            "Description": "lorem ipsum " * 50,
+            "URL": f"https://example.com/jobs/{i}",
+            "Skills": "",
+            "Website": "adzuna"
+        }
+
+
+def loc_append(n):
+    df = pd.DataFrame(columns=JOB_COLUMNS)
+    for row in _rows(n):
+        df.loc[len(df)] = row
+    return df
+
+
+def collect_once(n):
+    return append_rows(pd.DataFrame(columns=JOB_COLUMNS), list(_rows(n)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark DataFrame row appends in the scrapers")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 50000, 100000])
+    parser.add_argument("--skip-loc-above", type=int, default=5000, help="Skip the quadratic df.loc variant above this size")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        timings = {}
+        for name, fn in [("loc", loc_append), ("collect", collect_once)]:
+            if name == "loc" and args.skip_loc_above and n > args.skip_loc_above:
+                continue
+            start = time.perf_counter()
+            df = fn(n)
+            timings[name] = time.perf_counter() - start
+            assert len(df) == n
+        line = "  ".join(f"{name} {t:8.2f} s" for name, t in timings.items())
+        if len(timings) == 2:
+            line += f"  ({timings['loc'] / timings['collect']:.0f}x)"
+        print(f"{n:>7} rows  {line}")
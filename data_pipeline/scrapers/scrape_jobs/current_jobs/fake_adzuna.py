@@ -0,0 +1,138 @@
+"""
+Local fake of the Adzuna search API to exercise scrape_adzuna without API keys or quota.
+
+Run from data_pipeline/:
+    python -m scrapers.scrape_jobs.current_jobs.fake_adzuna
+"""
+import argparse
+import asyncio
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from . import locations
+from . import scrape_adzuna as adzuna
+
+PATH_RE = re.compile(r"^/(?P<country>[a-z]{2})/search/(?P<page>\d+)$")
+
+
+class FakeAdzuna(ThreadingHTTPServer):
+    """
+    Serves `jobs_per_query` jobs per country/query. The first request for every
+    `fail_every`-th query answers 429 (with Retry-After) and the next one 503,
+    so each of them needs two retries.
+    """
+
+    def __init__(self, jobs_per_query=120, fail_every=5, latency=0.05):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.jobs_per_query = jobs_per_query
+        self.fail_every = fail_every
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.hits = {}
+        self.request_times = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        match = PATH_RE.match(url.path)
+        if not match:
+            self._send(404, {"error": "not found"})
+            return
+        params = parse_qs(url.query)
+        query = params["what"][0]
+        per_page = int(params["results_per_page"][0])
+        country, page = match["country"], int(match["page"])
+
+        with server.lock:
+            server.request_times.append(time.monotonic())
+            key = (country, query, page)
+            server.hits[key] = server.hits.get(key, 0) + 1
+            attempt = server.hits[key]
+        time.sleep(server.latency)
+
+        if page == 1 and adzuna.JOB_TYPES.index(query) % server.fail_every == 0 and attempt <= 2:
+            if attempt == 1:
+                self._send(429, {"error": "rate limited"}, {"Retry-After": "0"})
+            else:
+                self._send(503, {"error": "unavailable"})
+            return
+
+        today = datetime.now()
+        start = (page - 1) * per_page
+        results = [
+            {
+                "title": f"{query} {i}",
+                "created": (today - timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "location": {"area": [locations.COUNTRY_MAP.get(country, country), f"City {i % 7}"]},
+                "company": {"display_name": f"Company {i % 11}"},
+                "description": f"{query} job {i} in {country}",
+                "redirect_url": f"https://example.com/{country}/{query}/{i}",
+            }
+            for i in range(start, min(start + per_page, server.jobs_per_query))
+        ]
+        self._send(200, {"count": server.jobs_per_query, "results": results})
+
+
+def run(jobs_per_query=120, max_pages=2, rate_per_minute=1200, concurrency=adzuna.CONCURRENCY):
+    server = FakeAdzuna(jobs_per_query=jobs_per_query)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    adzuna.BASE_URL = server.url
+    try:
+        stop_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+        start = time.perf_counter()
+        rows = asyncio.run(adzuna.scrape_adzuna_async(
+            stop_date, max_pages=max_pages, concurrency=concurrency, rate_per_minute=rate_per_minute
+        ))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    pairs = len(locations.TARGET_COUNTRIES) * len(adzuna.JOB_TYPES)
+    expected = pairs * min(jobs_per_query, max_pages * min(locations.RESULTS_PER_PAGE, 50))
+    assert len(rows) == expected, f"expected {expected} rows, got {len(rows)}"
+    assert len({r["URL"] for r in rows}) == expected, "duplicate rows"
+
+    # the bucket holds one token, so no window may see more than rate * window + 1 requests
+    times = sorted(server.request_times)
+    window = 5.0
+    busiest = max(sum(1 for t in times[i:] if t - t0 < window) for i, t0 in enumerate(times))
+    allowed = rate_per_minute / 60 * window + 1
+    assert busiest <= allowed, f"{busiest} requests in {window}s exceeds {allowed:.0f}"
+
+    print(f"{len(rows)} jobs, {len(times)} requests in {elapsed:.1f} s "
+          f"(busiest {window:.0f}s window: {busiest}, allowed {allowed:.0f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the async Adzuna scraper against a local fake API")
+    parser.add_argument("--jobs-per-query", type=int, default=120)
+    parser.add_argument("--max-pages", type=int, default=2)
+    parser.add_argument("--rate-per-minute", type=float, default=1200)
+    parser.add_argument("--concurrency", type=int, default=adzuna.CONCURRENCY)
+    args = parser.parse_args()
+    run(args.jobs_per_query, args.max_pages, args.rate_per_minute, args.concurrency)
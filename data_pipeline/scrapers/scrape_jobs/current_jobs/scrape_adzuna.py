@@ -1,16 +1,24 @@
 import os
 import dotenv
-import requests
-import pandas as pd
+import httpx
+import asyncio
+import random
 import time
 import math
-from datetime import datetime
 from . import locations
+from . import append_rows
 
 # Load API keys
 dotenv.load_dotenv()
 APP_ID = os.getenv("ADZUNA_APP_ID")
 APP_KEY = os.getenv("ADZUNA_APP_KEY")
+BASE_URL = os.getenv("ADZUNA_BASE_URL", "https://api.adzuna.com/v1/api/jobs")
+
+# Adzuna's default quota is 25 hits per minute
+RATE_PER_MINUTE = float(os.getenv("ADZUNA_RATE_PER_MINUTE", 25))
+CONCURRENCY = 4
+MAX_RETRIES = 4
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 # Load job categories
 current_folder = os.path.dirname(os.path.abspath(__file__))
@@ -18,124 +26,178 @@ job_file_path = os.path.join(current_folder, "job_categories.txt")
 with open(job_file_path, "r") as f:
     JOB_TYPES = [line.strip() for line in f if line.strip()]
 
-# SCRAPER (modified to accept existing DataFrame)
-def scrape_adzuna(df, stop_date, max_pages=2):
+
+class TokenBucket:
     """
-    Scrape Adzuna jobs until stop_date and append to existing DataFrame.
+    Async token bucket: `rate` requests per second on average, bursts of up to `capacity`
     """
-    print(f"Adzuna scrape until: {stop_date}")
 
-    temp = len(df)
-    stop_scraping = False
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def _get(client, bucket, url, params, label):
+    """
+    GET with rate limiting, retrying 429/5xx and timeouts with exponential backoff.
+    Returns the JSON body or None.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await bucket.acquire()
+        try:
+            r = await client.get(url, params=params)
+        except httpx.TransportError as e:
+            if attempt == MAX_RETRIES:
+                print(f"WARNING: {type(e).__name__} | {label}")
+                return None
+            await asyncio.sleep(2 ** attempt + random.random())
+            continue
+
+        if r.status_code == 200:
+            return r.json()
+        if r.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            retry_after = r.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + random.random()
+            await asyncio.sleep(delay)
+            continue
+
+        print(f"WARNING: adzuna scraping failed | {label} | status={r.status_code}")
+        print(r.text[:300])
+        return None
+
+
+def _parse_item(item, country_name, continent):
+    location_area = item.get("location", {}).get("area", [])
+    city = "Unknown"
+    for loc in reversed(location_area):
+        if loc not in locations.COUNTRY_BLOCKLIST:
+            city = loc
+            break
+
+    return {
+        "Job Title": item.get("title"),
+        "Continent": continent,
+        "Country": country_name,
+        "City": city,
+        "Date": item.get("created", "").split("T")[0],
+        "Company": item.get("company", {}).get("display_name"),
+        "Description": item.get("description"),
+        "URL": item.get("redirect_url"),
+        "Skills": "",
+        "Website": "adzuna"
+    }
+
+
+async def _scrape_query(client, bucket, semaphore, country_code, job_query, stop_date, max_pages, checkpoint=None):
+    """
+    All pages of one country/query pair, in page order. Pages saved in the checkpoint
+    are not fetched again.
+    """
+    country_name = locations.COUNTRY_MAP.get(country_code, country_code)
+    continent = locations.CONTINENT_MAP.get(country_code, "Unknown")
+    params = {
+        "app_id": APP_ID,
+        "app_key": APP_KEY,
+        "what": job_query,
+        "results_per_page": min(locations.RESULTS_PER_PAGE, 50),
+        "max_days_old": 5  # <- aligns with stop_date
+    }
 
+    rows = []
+    page, pages = 1, 1
+    unit = f"{country_code}/{job_query}"
+    for page, page_rows, state in (checkpoint.pages("adzuna", unit) if checkpoint is not None else []):
+        rows.extend(page_rows)
+        pages = state["pages"]
+        page += 1
+
+    if page > pages:
+        return rows
+    async with semaphore:
+        while page <= pages:
+            label = f"country={country_code} | query='{job_query}' | page={page}"
+            data = await _get(client, bucket, f"{BASE_URL}/{country_code}/search/{page}", params, label)
+            if data is None:
+                break
+            if page == 1:
+                pages = min(math.ceil(data.get("count", 0) / params["results_per_page"]), max_pages)
+
+            page_rows = []
+            for item in data.get("results", []):
+                row = _parse_item(item, country_name, continent)
+                if row["Date"] < stop_date:
+                    break  # <- only stops current page, not entire scraper
+                page_rows.append(row)
+
+            if checkpoint is not None:
+                last_date = page_rows[-1]["Date"] if page_rows else None
+                checkpoint.save_page("adzuna", unit, page, page_rows, {"pages": pages, "last_date": last_date})
+            rows.extend(page_rows)
+            page += 1
+    return rows
+
+
+async def scrape_adzuna_async(stop_date, max_pages=2, concurrency=CONCURRENCY, rate_per_minute=RATE_PER_MINUTE,
+                              checkpoint=None):
+    """
+    Scrape all TARGET_COUNTRIES x JOB_TYPES pairs concurrently over one connection pool.
+    Returns the job rows in country/query/page order.
+    """
+    bucket = TokenBucket(rate_per_minute / 60)
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
     headers = {
         "Accept": "application/json",
         "User-Agent": "Mozilla/5.0"
     }
 
-    for country_code in locations.TARGET_COUNTRIES:
-        if stop_scraping:
-            break
+    async with httpx.AsyncClient(headers=headers, limits=limits, timeout=10) as client:
+        tasks = [
+            _scrape_query(client, bucket, semaphore, country_code, job_query, stop_date, max_pages, checkpoint)
+            for country_code in locations.TARGET_COUNTRIES
+            for job_query in JOB_TYPES
+        ]
+        results = await asyncio.gather(*tasks)
+    return [row for rows in results for row in rows]
 
-        country_name = locations.COUNTRY_MAP.get(country_code, country_code)
-        continent = locations.CONTINENT_MAP.get(country_code, "Unknown")
-        print(f"🚩 {country_name}")
 
-        for job_query in JOB_TYPES:
-            if stop_scraping:
-                break
+def iter_adzuna(stop_date, max_pages=2, dedup=None, checkpoint=None):
+    """
+    Yield Adzuna job rows until stop_date.
+    Jobs already in the dedup index (if given) are skipped; pages saved in the
+    checkpoint (if given) are replayed instead of fetched.
+    """
+    print(f"Adzuna scrape until: {stop_date}")
 
-            base_url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/1"
-            params = {
-                "app_id": APP_ID,
-                "app_key": APP_KEY,
-                "what": job_query,
-                "results_per_page": min(locations.RESULTS_PER_PAGE, 50),
-                "max_days_old": 5  # <- aligns with stop_date
-            }
-
-            # ----- REQUEST WITH TIMEOUT HANDLING -----
-            try:
-                r = requests.get(
-                    base_url,
-                    params=params,
-                    headers=headers,
-                    timeout=10
-                )
-            except requests.exceptions.ReadTimeout:
-                print(f"WARNING: timeout | country={country_code} | query='{job_query}'")
-                continue
-
-            if r.status_code != 200:
-                print(
-                    f"WARNING: adzuna scraping failed | "
-                    f"country={country_code} | query='{job_query}' | "
-                    f"status={r.status_code}"
-                )
-                print(r.text[:300])
-                continue
-
-            data = r.json()
-            total = data.get("count", 0)
-            if total == 0:
-                continue
-
-            pages = min(math.ceil(total / params["results_per_page"]), max_pages)
-
-            for page in range(1, pages + 1):
-                if page > 1:
-                    page_url = f"https://api.adzuna.com/v1/api/jobs/{country_code}/search/{page}"
-                    try:
-                        r = requests.get(
-                            page_url,
-                            params=params,
-                            headers=headers,
-                            timeout=10
-                        )
-                    except requests.exceptions.ReadTimeout:
-                        print(f"WARNING: timeout | country={country_code} | page={page}")
-                        break
-
-                    if r.status_code != 200:
-                        print(
-                            f"WARNING: adzuna page failed | "
-                            f"country={country_code} | page={page} | "
-                            f"status={r.status_code}"
-                        )
-                        break
-
-                    results = r.json().get("results", [])
-                else:
-                    results = data.get("results", [])
-
-                for item in results:
-                    raw_date = item.get("created", "")
-                    job_date = raw_date.split("T")[0]
-
-                    if job_date < stop_date:
-                        break  # <- only stops current page, not entire scraper
-
-                    location_area = item.get("location", {}).get("area", [])
-                    city = "Unknown"
-                    for loc in reversed(location_area):
-                        if loc not in locations.COUNTRY_BLOCKLIST:
-                            city = loc
-                            break
-
-                    df.loc[len(df)] = {
-                        "Job Title": item.get("title"),
-                        "Continent": continent,
-                        "Country": country_name,
-                        "City": city,
-                        "Date": job_date,
-                        "Company": item.get("company", {}).get("display_name"),
-                        "Description": item.get("description"),
-                        "URL": item.get("redirect_url"),
-                        "Skills": "",
-                        "Website": "adzuna"
-                    }
-
-                time.sleep(1.5)  # keep polite pause
-
-    print(f"✅ Adzuna collected {len(df) - temp} total jobs")
-    return df
+    count = 0
+    for row in asyncio.run(scrape_adzuna_async(stop_date, max_pages=max_pages, checkpoint=checkpoint)):
+        if dedup is not None and not dedup.check(row):
+            continue
+        count += 1
+        yield row
+
+    print(f"✅ Adzuna collected {count} total jobs")
+
+
+# SCRAPER (modified to accept existing DataFrame)
+def scrape_adzuna(df, stop_date, max_pages=2, dedup=None, checkpoint=None):
+    """
+    Scrape Adzuna jobs until stop_date and append to existing DataFrame.
+    Jobs already in the dedup index (if given) are skipped.
+    """
+    rows = list(iter_adzuna(stop_date, max_pages=max_pages, dedup=dedup, checkpoint=checkpoint))
+    return append_rows(df, rows)
@@ -1,8 +1,8 @@
 import requests
-import pandas as pd
 import time
 import re
 from datetime import datetime
+from . import append_rows
 
 # Clean titles
 def clean_title(title):
@@ -25,16 +25,31 @@ def extract_city_country(raw_location):
     city = raw_location.split(',')[0].strip()
     return city, "Germany"
 
-# SCRAPER (modified to accept existing DataFrame)
-def scrape_arbeitnow(df, stop_date, max_pages=None):
+def iter_arbeitnow(stop_date, max_pages=None, dedup=None, checkpoint=None):
     """
-    Scrape Arbeitnow jobs until stop_date or max_pages and append to existing DataFrame.
+    Yield Arbeitnow job rows until stop_date or max_pages.
+    Jobs already in the dedup index (if given) are skipped. With a checkpoint, every
+    page is saved and a resumed run replays the saved pages before fetching the next one.
     """
     print(f"Arbeitnow scrape until: {stop_date}")
 
     url = "https://www.arbeitnow.com/api/job-board-api"
     page = 1
     stop_scraping = False
+    count = 0
+
+    saved = checkpoint.pages("arbeitnow", "all") if checkpoint is not None else []
+    if saved:
+        print(f"Resuming after page {saved[-1][0]}")
+    for page, page_rows, state in saved:
+        for row in page_rows:
+            if dedup is None or dedup.check(row):
+                count += 1
+                yield row
+        url = state.get("next")
+        stop_scraping = state.get("stop", False)
+    if saved:
+        page += 1
 
     while url and not stop_scraping:
         if max_pages and page > max_pages:
@@ -50,6 +65,7 @@ def scrape_arbeitnow(df, stop_date, max_pages=None):
         data = r.json()
         jobs = data.get("data", [])
 
+        page_rows = []
         for job in jobs:
             if not job.get("created_at"):
                 continue
@@ -59,9 +75,8 @@ def scrape_arbeitnow(df, stop_date, max_pages=None):
             if job_date < stop_date:
                 stop_scraping = True
                 break
-            
-            # Append row to existing DataFrame
-            df.loc[len(df)] = {
+
+            page_rows.append({
                 "Job Title": clean_title(job.get("title")),
                 "Continent": "Europe",
                 "Country": "Germany",
@@ -72,11 +87,30 @@ def scrape_arbeitnow(df, stop_date, max_pages=None):
                 "URL": job.get("url"),
                 "Skills": "",
                 "Website": "arbeitnow"
-            }
+            })
 
         url = data.get("links", {}).get("next")
+        if checkpoint is not None:
+            last_date = page_rows[-1]["Date"] if page_rows else None
+            checkpoint.save_page("arbeitnow", "all", page, page_rows,
+                                 {"next": url, "stop": stop_scraping, "last_date": last_date})
+
+        for row in page_rows:
+            if dedup is None or dedup.check(row):
+                count += 1
+                yield row
+
         page += 1
         time.sleep(1)
 
-    print(f"Arbeitnow collected {len(df)} total jobs")
-    return df
\ No newline at end of file
+    print(f"Arbeitnow collected {count} total jobs")
+
+
+# SCRAPER (modified to accept existing DataFrame)
+def scrape_arbeitnow(df, stop_date, max_pages=None, dedup=None, checkpoint=None):
+    """
+    Scrape Arbeitnow jobs until stop_date or max_pages and append to existing DataFrame.
+    Jobs already in the dedup index (if given) are skipped.
+    """
+    rows = list(iter_arbeitnow(stop_date, max_pages=max_pages, dedup=dedup, checkpoint=checkpoint))
+    return append_rows(df, rows)
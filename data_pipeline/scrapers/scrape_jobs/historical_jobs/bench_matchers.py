@@ -0,0 +1,109 @@
+"""
+Check the compiled matchers of scrape_hacker against the original per-word regex loops
+and time both, on a corpus of HN comments.
+
+Run from this folder:
+    python bench_matchers.py [--corpus hackernews_jobs.csv]
+Without a corpus (a CSV with a Description column), synthetic comments are used.
+"""
+import argparse
+import random
+import re
+import time
+import pandas as pd
+
+import locations
+import scrape_hacker
+
+
+def extract_location_data_reference(text):
+    text_lower = text.lower()
+    for city in locations.SORTED_CITIES:
+        if re.search(r'\b' + re.escape(city.lower()) + r'\b', text_lower):
+            country_code = locations.CITY_TO_COUNTRY[city]
+            if country_code == "Remote":
+                return "Remote", "Remote"
+            return city, country_code
+
+    if re.search(r'\bgermany\b|\bdeutschland\b|\bde\b', text_lower): return "Multiple/See Desc", "de"
+    if re.search(r'\buk\b|\bunited kingdom\b|\blondon\b', text_lower): return "Multiple/See Desc", "gb"
+    if re.search(r'\busa\b|\bunited states\b|\bnew york\b', text_lower): return "Multiple/See Desc", "us"
+
+    return None, None
+
+
+def find_title_in_text_reference(text, whitelist_list):
+    if not text: return None
+    processed_text = re.sub(r'[\/\|\-\(\):]', ' ', text).lower()
+    for known_title in whitelist_list:
+        pattern = r'\b' + re.escape(known_title.lower()) + r'\b'
+        if re.search(pattern, processed_text):
+            return known_title
+    return None
+
+
+def clean_title_text_reference(title):
+    if not title: return ""
+    clean = title.lower()
+    for term in scrape_hacker.TERMS_TO_REMOVE:
+        pattern = r'\b' + re.escape(term) + r'\b'
+        clean = re.sub(pattern, '', clean)
+    clean = re.sub(r'^[\/\\\^\-\*\s]+', '', clean)
+    clean = clean.replace('(', '').replace(')', '').replace(',', '').strip()
+    clean = re.sub(r'\s+', ' ', clean)
+    return clean.title()
+
+
+def synthetic_corpus(n, seed=0):
+    rnd = random.Random(seed)
+    words = ("we are a small team building tools for data engineering and ml platforms "
+             "apply via email onsite hybrid remote friendly visa competitive salary equity").split()
+    places = locations.SORTED_CITIES + ["Germany", "UK", "USA", "Deutschland", "United States", "Mars", "Yorkshire"]
+    titles = scrape_hacker.KNOWN_JOB_TITLES_LIST or ["Software Engineer", "Data Scientist"]
+    corpus = []
+    for i in range(n):
+        header = f"Company{i} | {rnd.choice(titles)} | {rnd.choice(places)} | {rnd.choice(['Full-time', 'Contract', 'REMOTE'])}"
+        body = " ".join(rnd.choice(words + places[:5] + titles[:20]) for _ in range(rnd.randint(40, 160)))
+        corpus.append(header + "\n" + body)
+    return corpus
+
+
+def compare(name, reference, compiled, texts):
+    start = time.perf_counter()
+    expected = [reference(t) for t in texts]
+    t_ref = time.perf_counter() - start
+    start = time.perf_counter()
+    got = [compiled(t) for t in texts]
+    t_new = time.perf_counter() - start
+    mismatches = [(t[:80], e, g) for t, e, g in zip(texts, expected, got) if e != g]
+    print(f"{name:<24} {len(texts)} texts  reference {t_ref:7.2f} s  compiled {t_new:7.2f} s  "
+          f"({t_ref / t_new:5.1f}x)  mismatches: {len(mismatches)}")
+    for m in mismatches[:5]:
+        print("   ", m)
+    return not mismatches
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--corpus", help="CSV with a Description column (e.g. hackernews_jobs.csv)")
+    parser.add_argument("--n", type=int, default=5000, help="Synthetic comments when no corpus is given")
+    args = parser.parse_args()
+
+    if args.corpus:
+        corpus = pd.read_csv(args.corpus)["Description"].dropna().astype(str).tolist()
+    else:
+        corpus = synthetic_corpus(args.n)
+    headers = [c.split("\n")[0] for c in corpus]
+    snippets = [c[:200] for c in corpus]
+
+    ok = compare("location (header)", extract_location_data_reference, scrape_hacker.extract_location_data, headers)
+    ok &= compare("location (body[:200])", extract_location_data_reference, scrape_hacker.extract_location_data, snippets)
+
+    titles = scrape_hacker.KNOWN_JOB_TITLES_LIST
+    ok &= compare("title (header)", lambda t: find_title_in_text_reference(t, titles),
+                  lambda t: scrape_hacker.find_title_in_text(t, titles), headers)
+    ok &= compare("title (body[:1000])", lambda t: find_title_in_text_reference(t[:1000], titles),
+                  lambda t: scrape_hacker.find_title_in_text(t[:1000], titles), corpus)
+    parts = [p.strip() for h in headers for p in h.split("|")]
+    ok &= compare("clean_title_text", clean_title_text_reference, scrape_hacker.clean_title_text, parts)
+    raise SystemExit(0 if ok else 1)
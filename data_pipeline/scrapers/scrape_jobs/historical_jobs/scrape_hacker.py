@@ -1,10 +1,16 @@
 import requests
 import pandas as pd
-import time
 import re
 import os
 import html
+import threading
+import sqlite3
+import time
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 # Note: This requires a 'locations.py' file in the same directory containing:
 # SORTED_CITIES, CITY_TO_COUNTRY, TARGET_COUNTRIES, CONTINENT_MAP, COUNTRY_MAP
 import locations as locations
@@ -15,6 +21,12 @@ YEARS_TO_SCRAPE = 20
 OUTPUT_DIR = 'database/data/job_data'
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'hackernews_jobs.csv') 
 JOB_TITLES_FILENAME = 'job_titles.txt' 
+FETCH_WORKERS = 4                      # threads fetched from Algolia at the same time
+PARSE_WORKERS = os.cpu_count() or 1    # processes parsing comments
+PARSE_CHUNK_SIZE = 100                 # comments per parsing task
+YC_CACHE_FILE = os.path.join(OUTPUT_DIR, 'yc_title_cache.sqlite')
+YC_CACHE_TTL_DAYS = 90                 # found titles
+YC_CACHE_NEGATIVE_TTL_DAYS = 7         # pages without a title / failed requests
 
 # --- STATS CONTAINER ---
 SCRAPE_STATS = {
@@ -28,12 +40,86 @@ SCRAPE_STATS = {
     'failed_descriptions': [] 
 }
 
+def merge_stats(stats):
+    """
+    Add the stats returned by a worker process to SCRAPE_STATS
+    """
+    for key, value in stats.items():
+        SCRAPE_STATS[key] += value
+    del SCRAPE_STATS['failed_descriptions'][20:]
+
+# --- HTTP SESSION ---
+# One keep-alive session per thread (requests.Session is not guaranteed thread safe)
+_local = threading.local()
+
+def get_session():
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retry)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['User-Agent'] = 'Mozilla/5.0'
+        _local.session = session
+    return session
+
+# --- MULTI-WORD MATCHING ---
+def _trie_regex(words):
+    """
+    Regex source matching any of `words`, factored into a prefix trie so the engine
+    follows one branch per character instead of trying every word. At a given
+    position the longest word that can match is tried first.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def to_regex(node):
+        branches = [re.escape(char) + to_regex(child) for char, child in node.items() if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # ending here is the fallback, so deeper (longer) matches win
+        return '(?:' + body + ')?' if '' in node else body
+
+    return to_regex(trie)
+
+class LongestWordMatcher:
+    """
+    Finds which of a ranked list of words occurs in a text as a whole word, returning
+    the one with the best rank - the same answer as testing each word in turn with a
+    word-boundary re.search, but with one compiled pattern. Words must be lowercase.
+    """
+
+    def __init__(self, words):
+        self.rank = {}
+        for i, word in enumerate(words):
+            self.rank.setdefault(word, i)
+        # lookahead so overlapping candidates at every start position are seen
+        self.pattern = re.compile(r'(?=\b(' + _trie_regex(self.rank) + r')\b)') if self.rank else None
+
+    def search(self, text_lower):
+        if self.pattern is None:
+            return None
+        best = None
+        for match in self.pattern.finditer(text_lower):
+            rank = self.rank[match.group(1)]
+            if best is None or rank < best:
+                best = rank
+                if best == 0: break
+        return best
+
 # --- JOB TITLE WHITELIST LOADING ---
 KNOWN_JOB_TITLES = set() 
 KNOWN_JOB_TITLES_LIST = [] 
+TITLE_MATCHER = LongestWordMatcher([])
 
 def load_job_titles():
-    global KNOWN_JOB_TITLES, KNOWN_JOB_TITLES_LIST
+    global KNOWN_JOB_TITLES, KNOWN_JOB_TITLES_LIST, TITLE_MATCHER
     
     # Determine potential paths for the file
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -57,6 +143,9 @@ def load_job_titles():
                     
                     # 2. Create Set (Lowercased for Exact Match Check)
                     KNOWN_JOB_TITLES = set(t.lower() for t in raw_titles)
+
+                    # 3. Compile the whole list into one matcher for find_title_in_text
+                    TITLE_MATCHER = LongestWordMatcher([t.lower() for t in KNOWN_JOB_TITLES_LIST])
                     
                     print(f"✅ FOUND: Loaded {len(KNOWN_JOB_TITLES)} titles from: {path}")
                     loaded = True
@@ -103,6 +192,12 @@ TERMS_TO_REMOVE = [
     "yoe", "years of experience", "3+ yoe", "5+ yoe"
 ]
 
+# Applied one after the other, in list order, as before
+TERMS_TO_REMOVE_PATTERNS = [re.compile(r'\b' + re.escape(term) + r'\b') for term in TERMS_TO_REMOVE]
+LEADING_SYMBOLS = re.compile(r'^[\/\\\^\-\*\s]+')
+WHITESPACE = re.compile(r'\s+')
+TITLE_SEPARATORS = re.compile(r'[\/\|\-\(\):]')
+
 LOCATION_BLOCKLIST = set()
 for city in locations.SORTED_CITIES:
     LOCATION_BLOCKLIST.add(city.lower())
@@ -113,30 +208,36 @@ LOCATION_BLOCKLIST.update(["usa", "uk", "uae", "can", "ger", "nz", "aus"])
 
 # --- 1. EXTRACTION LOGIC ---
 
+CITY_MATCHER = LongestWordMatcher([city.lower() for city in locations.SORTED_CITIES])
+COUNTRY_FALLBACKS = [
+    (re.compile(r'\bgermany\b|\bdeutschland\b|\bde\b'), "de"),
+    (re.compile(r'\buk\b|\bunited kingdom\b|\blondon\b'), "gb"),
+    (re.compile(r'\busa\b|\bunited states\b|\bnew york\b'), "us"),
+]
+
 def extract_location_data(text):
     text_lower = text.lower()
-    for city in locations.SORTED_CITIES:
-        if re.search(r'\b' + re.escape(city.lower()) + r'\b', text_lower):
-            country_code = locations.CITY_TO_COUNTRY[city]
-            if country_code == "Remote":
-                return "Remote", "Remote"
-            return city, country_code
+    rank = CITY_MATCHER.search(text_lower)
+    if rank is not None:
+        city = locations.SORTED_CITIES[rank]
+        country_code = locations.CITY_TO_COUNTRY[city]
+        if country_code == "Remote":
+            return "Remote", "Remote"
+        return city, country_code
 
-    if re.search(r'\bgermany\b|\bdeutschland\b|\bde\b', text_lower): return "Multiple/See Desc", "de"
-    if re.search(r'\buk\b|\bunited kingdom\b|\blondon\b', text_lower): return "Multiple/See Desc", "gb"
-    if re.search(r'\busa\b|\bunited states\b|\bnew york\b', text_lower): return "Multiple/See Desc", "us"
+    for pattern, country_code in COUNTRY_FALLBACKS:
+        if pattern.search(text_lower): return "Multiple/See Desc", country_code
 
     return None, None
 
 def clean_title_text(title):
     if not title: return ""
     clean = title.lower()
-    for term in TERMS_TO_REMOVE:
-        pattern = r'\b' + re.escape(term) + r'\b'
-        clean = re.sub(pattern, '', clean)
-    clean = re.sub(r'^[\/\\\^\-\*\s]+', '', clean) # Remove starting symbols
+    for pattern in TERMS_TO_REMOVE_PATTERNS:
+        clean = pattern.sub('', clean)
+    clean = LEADING_SYMBOLS.sub('', clean) # Remove starting symbols
     clean = clean.replace('(', '').replace(')', '').replace(',', '').strip()
-    clean = re.sub(r'\s+', ' ', clean)
+    clean = WHITESPACE.sub(' ', clean)
     return clean.title() 
 
 def is_valid_title(title):
@@ -156,11 +257,77 @@ def is_valid_title(title):
 
     return True
 
+class TitleCache:
+    """
+    On-disk URL -> title cache for fetch_yc_job_title. Misses (None) are cached too,
+    for a shorter time, so dead links are not retried on every backfill.
+    """
+
+    def __init__(self, path=YC_CACHE_FILE):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS yc_title (url TEXT PRIMARY KEY, title TEXT, fetched_at REAL)")
+
+    def get(self, url):
+        """
+        (True, title) for a fresh entry, (False, None) otherwise
+        """
+        row = self.conn.execute("SELECT title, fetched_at FROM yc_title WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return False, None
+        title, fetched_at = row
+        ttl_days = YC_CACHE_TTL_DAYS if title is not None else YC_CACHE_NEGATIVE_TTL_DAYS
+        if time.time() - fetched_at > ttl_days * 86400:
+            return False, None
+        return True, title
+
+    def put_many(self, items):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO yc_title (url, title, fetched_at) VALUES (?, ?, ?)",
+                [(url, title, time.time()) for url, title in items],
+            )
+
+_yc_cache = None
+
+def get_yc_cache():
+    global _yc_cache
+    if _yc_cache is None:
+        _yc_cache = TitleCache(YC_CACHE_FILE)
+    return _yc_cache
+
+def is_yc_url(url):
+    return bool(url) and ("ycombinator.com/companies" in url or "workatastartup.com" in url)
+
 def fetch_yc_job_title(url):
+    """
+    Job title from a YC / Work at a Startup page, served from the on-disk cache when possible
+    """
+    if not is_yc_url(url): return None
+    cache = get_yc_cache()
+    found, title = cache.get(url)
+    if not found:
+        title = _fetch_yc_job_title_live(url)
+        cache.put_many([(url, title)])
+    return title
+
+def prefetch_yc_job_titles(urls, workers=FETCH_WORKERS):
+    """
+    Fetch the uncached YC URLs concurrently and store them, so the following
+    fetch_yc_job_title calls are cache hits
+    """
+    cache = get_yc_cache()
+    missing = [url for url in dict.fromkeys(urls) if is_yc_url(url) and not cache.get(url)[0]]
+    if not missing: return
+    print(f"   > Fetching {len(missing)} uncached YC job pages...")
+    with ThreadPoolExecutor(workers) as pool:
+        titles = list(pool.map(_fetch_yc_job_title_live, missing))
+    cache.put_many(zip(missing, titles))
+
+def _fetch_yc_job_title_live(url):
     try:
-        if "ycombinator.com/companies" not in url and "workatastartup.com" not in url: return None
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(url, headers=headers, timeout=5)
+        response = get_session().get(url, timeout=5)
         if response.status_code == 200:
             title_match = re.search(r'<title>(.*?) at .*?</title>', response.text, re.IGNORECASE)
             if title_match: return title_match.group(1).strip()
@@ -177,16 +344,21 @@ def find_title_in_text(text, whitelist_list):
     if not text: return None
     # Pre-process: replace separators like '|' or '/' or ':' with spaces
     # This helps "Fabric8Labs | Software Developer" become "Fabric8Labs   Software Developer"
-    processed_text = re.sub(r'[\/\|\-\(\):]', ' ', text).lower()
-    
-    for known_title in whitelist_list:
-        # Use regex boundary \b to match exact words
-        pattern = r'\b' + re.escape(known_title.lower()) + r'\b'
-        if re.search(pattern, processed_text):
-            return known_title
-    return None
+    processed_text = TITLE_SEPARATORS.sub(' ', text).lower()
+
+    # The loaded whitelist has its matcher compiled by load_job_titles()
+    if whitelist_list is KNOWN_JOB_TITLES_LIST:
+        matcher = TITLE_MATCHER
+    else:
+        matcher = LongestWordMatcher([t.lower() for t in whitelist_list])
+    rank = matcher.search(processed_text)
+    return whitelist_list[rank] if rank is not None else None
 
-def extract_job_title_dynamic(header, description, url):
+def extract_job_title_dynamic(header, description, url, fetch_external=True):
+    """
+    Job title of a comment. With fetch_external=False the validated candidate (or None)
+    is returned without strategy C; finish_job_title() completes it later.
+    """
     clean_header = header.strip()
     candidate_title = None
 
@@ -241,10 +413,16 @@ def extract_job_title_dynamic(header, description, url):
         if not is_valid_title(candidate_title):
             candidate_title = None
 
+    if not fetch_external: return candidate_title
+    return finish_job_title(candidate_title, description, url)
+
+def needs_external_title(candidate_title):
+    if not candidate_title: return True
+    return candidate_title.lower() in ["engineers", "hiring", "team", "everyone", "builders"]
+
+def finish_job_title(candidate_title, description, url):
     # --- STRATEGY C: EXTERNAL SCRAPE ---
-    should_scrape = False
-    if not candidate_title: should_scrape = True
-    elif candidate_title.lower() in ["engineers", "hiring", "team", "everyone", "builders"]: should_scrape = True
+    should_scrape = needs_external_title(candidate_title)
         
     if should_scrape and url:
         SCRAPE_STATS['attempts'] += 1
@@ -268,17 +446,17 @@ def extract_job_title_dynamic(header, description, url):
 
 # --- 2. PROCESS THREAD ---
 
-def process_thread(thread_item):
+def fetch_thread_comments(thread_item):
+    """
+    All comments of a thread, paging through Algolia on the shared session
+    """
     thread_id = thread_item['id']
-    date_str = thread_item['date']
-    print(f"   > Processing Thread {date_str} (ID: {thread_id})...")
-    
     all_comments = []
     page = 0
     while True:
         api_url = f"http://hn.algolia.com/api/v1/search_by_date?tags=comment,story_{thread_id}&hitsPerPage=1000&page={page}"
         try:
-            r = requests.get(api_url)
+            r = get_session().get(api_url, timeout=30)
             if r.status_code != 200: break
             data = r.json()
             hits = data.get('hits', [])
@@ -286,13 +464,18 @@ def process_thread(thread_item):
             all_comments.extend(hits)
             if page >= data.get('nbPages', 0) - 1: break
             page += 1
-            time.sleep(0.5) 
         except Exception: break
 
-    print(f"     ✅ Extracted {len(all_comments)} raw comments.")
+    print(f"   > Thread {thread_item['date']} (ID: {thread_id}): {len(all_comments)} raw comments.")
+    return all_comments
+
+def parse_comments(comments, thread_id, date_str, fetch_external=True):
+    """
+    Turn the raw comments of a thread into jobs. With fetch_external=False, jobs whose
+    title needs finish_job_title() carry "_pending_title": (candidate, url).
+    """
     extracted_jobs = []
-    
-    for comment in all_comments:
+    for comment in comments:
         if not comment or not comment.get('comment_text'): continue
         raw_text = comment['comment_text']
         clean_text = html.unescape(re.sub(r'<[^>]+>', ' ', raw_text)).strip()
@@ -314,7 +497,7 @@ def process_thread(thread_item):
         hn_url = f"https://news.ycombinator.com/item?id={comment['objectID']}"
         final_url = job_url if job_url else hn_url
 
-        job_title = extract_job_title_dynamic(header, clean_text, job_url)
+        job_title = extract_job_title_dynamic(header, clean_text, job_url, fetch_external)
 
         continent = locations.CONTINENT_MAP.get(country_code, "Unknown")
         country_name = locations.COUNTRY_MAP.get(country_code, country_code)
@@ -330,10 +513,61 @@ def process_thread(thread_item):
             "URL": final_url,
             "Skills": "None"
         }
+        if not fetch_external:
+            job["_pending_title"] = (job_title, job_url)
         extracted_jobs.append(job)
         
     return extracted_jobs
 
+def _parse_chunk(comments, thread_id, date_str):
+    """
+    Worker process entry point: returns the jobs and the SCRAPE_STATS of this chunk only
+    """
+    for key, value in SCRAPE_STATS.items():
+        SCRAPE_STATS[key] = [] if isinstance(value, list) else 0
+    jobs = parse_comments(comments, thread_id, date_str, fetch_external=False)
+    return jobs, dict(SCRAPE_STATS)
+
+def process_thread(thread_item):
+    """
+    Fetch and parse a single thread in this process
+    """
+    comments = fetch_thread_comments(thread_item)
+    return parse_comments(comments, thread_item['id'], thread_item['date'])
+
+def process_threads(threads, fetch_workers=FETCH_WORKERS, parse_workers=PARSE_WORKERS):
+    """
+    Fetch threads concurrently over pooled sessions and parse their comments in a
+    process pool, in chunks of PARSE_CHUNK_SIZE. Jobs keep the order of `threads`.
+    """
+    # spawn: forking while fetch threads hold sockets and locks is unsafe
+    parser_context = multiprocessing.get_context("spawn")
+    with ThreadPoolExecutor(fetch_workers) as fetchers, \
+            ProcessPoolExecutor(parse_workers, mp_context=parser_context) as parsers:
+        fetched = [fetchers.submit(fetch_thread_comments, thread) for thread in threads]
+        parsed = []
+        for thread, future in zip(threads, fetched):
+            comments = future.result()
+            for start in range(0, len(comments), PARSE_CHUNK_SIZE):
+                chunk = comments[start:start + PARSE_CHUNK_SIZE]
+                parsed.append(parsers.submit(_parse_chunk, chunk, thread['id'], thread['date']))
+
+        all_jobs = []
+        for future in parsed:
+            jobs, stats = future.result()
+            all_jobs.extend(jobs)
+            merge_stats(stats)
+
+    # Strategy C runs here, after fetching all uncached YC pages at once
+    prefetch_yc_job_titles(
+        url for job in all_jobs
+        for candidate, url in [job["_pending_title"]] if needs_external_title(candidate)
+    )
+    for job in all_jobs:
+        candidate, url = job.pop("_pending_title")
+        job["Job Title"] = finish_job_title(candidate, job["Description"], url)
+    return all_jobs
+
 # --- 3. FIND THREADS ---
 
 def get_hiring_threads(years=10):
@@ -345,7 +579,7 @@ def get_hiring_threads(years=10):
         "hitsPerPage": 1000,
         "numericFilters": f"created_at_i>{datetime(start_year, 1, 1).timestamp()}"
     }
-    r = requests.get(api_url, params=params)
+    r = get_session().get(api_url, params=params, timeout=30)
     data = r.json()
     threads = []
     for hit in data['hits']:
@@ -358,12 +592,8 @@ def get_hiring_threads(years=10):
 if __name__ == "__main__":
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     threads = get_hiring_threads(years=YEARS_TO_SCRAPE)
-    all_jobs = []
-    for thread in threads:
-        jobs = process_thread(thread)
-        all_jobs.extend(jobs)
-        time.sleep(1) 
-        
+    all_jobs = process_threads(threads)
+
     df = pd.DataFrame(all_jobs)
     
     if not df.empty:
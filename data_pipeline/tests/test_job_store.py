@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent))
+from job_store import COLUMNS, append_jobs, read_jobs
+
+
+def _jobs(urls, skills):
+    return pd.DataFrame({
+        "Job Title": "Data Engineer",
+        "Continent": "Europe",
+        "Country": "Germany",
+        "City": "Berlin",
+        "Date": "2026-10-01",
+        "Company": "ACME",
+        "Description": [f"job {u}" for u in urls],
+        "URL": urls,
+        "Skills": skills,
+        "Website": "adzuna",
+    })
+
+
+def test_empty_skills_batch_then_non_empty_batch(tmp_path):
+    assert append_jobs(_jobs(["a", "b"], [[], []]), tmp_path) == 2
+    assert append_jobs(_jobs(["c"], [["Python", "SQL"]]), tmp_path) == 1
+
+    df = read_jobs(tmp_path).sort_values("URL", ignore_index=True)
+    assert df["URL"].tolist() == ["a", "b", "c"]
+    assert [list(s) for s in df["Skills"]] == [[], [], ["Python", "SQL"]]
+
+
+def test_missing_and_empty_directory_read_as_empty(tmp_path):
+    for dataset_dir in [tmp_path / "missing", tmp_path]:
+        df = read_jobs(dataset_dir)
+        assert df.empty
+        assert list(df.columns) == COLUMNS
+        assert read_jobs(dataset_dir, columns=["URL"]).columns.tolist() == ["URL"]
@@ -0,0 +1,142 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+# Disk-backed cache of sentence embeddings, keyed by model + text, so only
+# strings never seen before are sent through the model.
+CACHE_PATH = Path(os.getenv("EMBEDDING_CACHE_PATH", Path(__file__).parent / "embedding_cache.sqlite"))
+MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", 2_000_000))
+
+_SQL_BATCH = 900  # stays below SQLite's bound-parameter limit
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """SQLite blob store of float32 vectors with least-recently-used eviction."""
+
+    def __init__(self, path: Path = CACHE_PATH, max_entries: int = MAX_ENTRIES):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(str(self.path), timeout=30)
+        with self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS embedding ("
+                " key BLOB PRIMARY KEY, model TEXT, vec BLOB, last_used REAL)"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS ix_embedding_last_used ON embedding (last_used)")
+        # kept in memory so puts don't scan the table; re-counted only when eviction looks due
+        self.count = self._count()
+
+    def _count(self) -> int:
+        return self.conn.execute("SELECT count(*) FROM embedding").fetchone()[0]
+
+    @staticmethod
+    def key(model_name: str, text: str, normalized: bool) -> bytes:
+        raw = f"{model_name}\x1f{int(normalized)}\x1f{text}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=20).digest()
+
+    def get_many(self, keys: List[bytes]) -> dict:
+        found = {}
+        for start in range(0, len(keys), _SQL_BATCH):
+            chunk = keys[start:start + _SQL_BATCH]
+            marks = ",".join("?" * len(chunk))
+            for key, vec in self.conn.execute(f"SELECT key, vec FROM embedding WHERE key IN ({marks})", chunk):
+                found[key] = np.frombuffer(vec, dtype=np.float32)
+        if found:
+            now = time.time()
+            with self.conn:
+                self.conn.executemany("UPDATE embedding SET last_used = ? WHERE key = ?", [(now, k) for k in found])
+        return found
+
+    def put_many(self, model_name: str, items) -> None:
+        now = time.time()
+        with self.conn:
+            # same key means same model, flag and text, so a row another process wrote meanwhile is kept
+            cur = self.conn.executemany(
+                "INSERT OR IGNORE INTO embedding (key, model, vec, last_used) VALUES (?, ?, ?, ?)",
+                [(k, model_name, np.asarray(v, dtype=np.float32).tobytes(), now) for k, v in items],
+            )
+        self.count += max(cur.rowcount, 0)
+        if self.count > self.max_entries:
+            self.evict()
+
+    def evict(self) -> None:
+        # other processes may share the file, so trust only a fresh count here
+        self.count = self._count()
+        if self.count <= self.max_entries:
+            return
+        with self.conn:
+            cur = self.conn.execute(
+                "DELETE FROM embedding WHERE key IN (SELECT key FROM embedding ORDER BY last_used LIMIT ?)",
+                (self.count - self.max_entries,),
+            )
+        self.count -= cur.rowcount
+
+    def __len__(self) -> int:
+        return self._count()
+
+
+_default_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = EmbeddingCache()
+    return _default_cache
+
+
+def model_name_of(model) -> str:
+    """Name the model was loaded under by model_registry.get_sentence_model."""
+    name = getattr(model, "registry_name", None)
+    if not name:
+        raise ValueError("Pass model_name to cached_encode for models not loaded through model_registry")
+    return name
+
+
+def cached_encode(
+    model,
+    texts: List[str],
+    normalize_embeddings: bool = False,
+    batch_size: int = 256,
+    model_name: Optional[str] = None,
+    cache: Optional[EmbeddingCache] = None,
+    show_progress_bar: bool = False,
+) -> np.ndarray:
+    """model.encode(texts) as a float32 (len(texts), dim) array, encoding only cache misses."""
+    texts = list(texts)
+    if not texts:
+        return np.zeros((0, model.get_sentence_embedding_dimension()), dtype=np.float32)
+    if cache is None:
+        cache = get_embedding_cache()
+    model_name = model_name or model_name_of(model)
+
+    keys = [cache.key(model_name, t, normalize_embeddings) for t in texts]
+    found = cache.get_many(list(dict.fromkeys(keys)))
+
+    missing = {}
+    for k, t in zip(keys, texts):
+        if k not in found and k not in missing:
+            missing[k] = t
+    if missing:
+        new = model.encode(
+            list(missing.values()),
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=normalize_embeddings,
+            show_progress_bar=show_progress_bar,
+        ).astype(np.float32)
+        new_items = list(zip(missing.keys(), new))
+        cache.put_many(model_name, new_items)
+        found.update(new_items)
+
+    logger.debug("Embedding cache: %d hits, %d encoded (%s)", len(texts) - len(missing), len(missing), model_name)
+    return np.stack([found[k] for k in keys])
@@ -18,9 +18,9 @@ from collections import Counter, defaultdict
 import numpy as np
 
 
-from sentence_transformers import SentenceTransformer, util
-
 import hdbscan
+from data_processing.embedding_cache import cached_encode
+from data_processing.model_registry import canonical_model_name, get_sentence_model, get_spacy
 
 # --------------------------------------------------------------------
 # CONFIG
@@ -30,7 +30,6 @@ REMOVE_ENTS = {"GPE", "LOC", "PERSON", "DATE", "TIME"}
 
 
 EMBEDDING_BACKEND = "sbert"
-import spacy
 # spaCy is a modern, high-performance NLP library used for:
 # tokenization (splitting text into words)
 # lemmatization (converting words to their base form)
@@ -49,19 +48,18 @@ with open(file_path, "r") as f:
     skills_list = [skill.strip() for skill in f.readlines() if skill.strip()] 
 
 class EmbeddingEngine:
-    def __init__(self):
-        self.model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+        self.model_name = canonical_model_name(model_name)
+        self.model = get_sentence_model(model_name)
         
 
     def embed(self, texts: List[str]) -> np.ndarray:
-        embs = self.model.encode(texts, convert_to_numpy=True, show_progress_bar=False, normalize_embeddings=True)
-        # ensure float32 for faiss compatibility if used later
-        return embs.astype(np.float32)
+        # float32 for faiss compatibility if used later; served from the embedding cache
+        return cached_encode(self.model, texts, normalize_embeddings=True, model_name=self.model_name)
         
 def extract_noun_phrases(description_list:List[str], language: str = 'en') -> List[str]:
     """Extract candidate phrases. spaCy based chunks"""
-    nlp_string = f"{language}_core_web_sm"
-    nlp = spacy.load(nlp_string)
+    nlp = get_spacy(f"{language}_core_web_sm")
 
     candidates_per_job = []
     all_candidates = []
@@ -124,13 +122,14 @@ def ner_filter(candidates, nlp):
         idx.append(i)
     return out, idx
 
-def extract_skills_batched(job_descriptions, skills, model, threshold=0.75, low_similarity_threshold=0.5) -> Tuple[List[List[str]], List[List[str]], List[str], List[str]]:
+def extract_skills_batched(job_descriptions, skills, model, threshold=0.75, low_similarity_threshold=0.5, model_name=None) -> Tuple[List[List[str]], List[List[str]], List[str], List[str]]:
     """
     job_descriptions: List[str]
     skills: List[str]
     model: embedding model
     treshhold: float
     low_similarity_threshold: float values that do not make the treshhold but low similiarity treshhold are considered for new skill discovey. This value was obtaines by masking out existing skills on which the llm was trained, performance on new words need to be verified.
+    model_name: str name the embedding cache keys the model's vectors by (defaults to its model_registry name)
     returns:
         per_job_candidates: List[List[str]]
         per_job_skills: List[List[str]]
@@ -141,7 +140,7 @@ def extract_skills_batched(job_descriptions, skills, model, threshold=0.75, low_
     
     # === Embed all skills once ===
     skill_start = time.time()
-    skill_embeddings = model.encode(skills, normalize_embeddings=True)
+    skill_embeddings = cached_encode(model, skills, normalize_embeddings=True, model_name=model_name)
     skill_time = time.time() - skill_start
     print(f"✓ Embedded {len(skills)} skills in {skill_time:.2f}s")
 
@@ -158,7 +157,7 @@ def extract_skills_batched(job_descriptions, skills, model, threshold=0.75, low_
 
     # === Embed all candidates in one big batch ===
     embed_start = time.time()
-    cand_emb = model.encode(all_candidates, normalize_embeddings=True)
+    cand_emb = cached_encode(model, all_candidates, normalize_embeddings=True, model_name=model_name)
     embed_time = time.time() - embed_start
     print(f"✓ Embedded {len(all_candidates)} candidates in {embed_time:.2f}s")
 
@@ -279,8 +278,6 @@ def discover_new_skills(all_new_terms, all_new_embeddings, canonical_emb,
 
     return final_new_skills, final_with_freq, labels
 
-    from sentence_transformers import SentenceTransformer, util
-import numpy as np
 
 def filter_candidates_hybrid(
     candidates,
@@ -307,19 +304,20 @@ def filter_candidates_hybrid(
         return []
 
     # Load model
-    model = SentenceTransformer("all-MiniLM-L6-v2")
+    model_name = canonical_model_name("all-MiniLM-L6-v2")
+    model = get_sentence_model(model_name)
 
     # 1️⃣ Embed candidates and anchor skills
-    cand_emb = model.encode(candidates, convert_to_tensor=True)
-    anchor_emb = model.encode(skill_anchor, convert_to_tensor=True)
+    cand_emb = cached_encode(model, candidates, model_name=model_name)
+    anchor_emb = cached_encode(model, skill_anchor, model_name=model_name)
 
     # 2️⃣ Compute max cosine similarity to anchor
-    cos_sims = util.cos_sim(cand_emb, anchor_emb)  # shape: (num_candidates, num_anchors)
-    max_sims = cos_sims.max(dim=1).values.cpu().numpy()
+    cos_sims = cosine_sim_matrix(cand_emb, anchor_emb)  # shape: (num_candidates, num_anchors)
+    max_sims = cos_sims.max(axis=1)
 
     # 3️⃣ Filter by similarity threshold
     filtered_candidates = [c for c, sim in zip(candidates, max_sims) if sim >= similarity_threshold]
-    filtered_emb = [cand_emb[i] for i, sim in enumerate(max_sims) if sim >= similarity_threshold]
+    filtered_emb = cand_emb[max_sims >= similarity_threshold]
 
     if not filtered_candidates:
         return []
@@ -332,7 +330,7 @@ def filter_candidates_hybrid(
             print("HDBSCAN not installed, skipping clustering")
             return filtered_candidates
 
-        emb_matrix = np.stack([e.cpu().numpy() for e in filtered_emb])
+        emb_matrix = filtered_emb
         clusterer = hdbscan.HDBSCAN(min_cluster_size=cluster_min_size)
         labels = clusterer.fit_predict(emb_matrix)
 
@@ -410,11 +408,13 @@ def remove_job_titles_from_candidates(candidates, blacklist):
     return filtered
 
 def search_for_skills(df: pd.DataFrame, skills_list: List[str]):
+    engine = EmbeddingEngine()
     _, per_job_skills, all_used_skills,all_new_skills = extract_skills_batched(
         job_descriptions=df['Description'].tolist(),
         skills=skills_list,
-        model=EmbeddingEngine().model,
-        threshold=0.75
+        model=engine.model,
+        threshold=0.75,
+        model_name=engine.model_name
     )
     return per_job_skills
 
@@ -426,6 +426,7 @@ def search_for_skills_batch(df: pd.DataFrame, skills_list: List[str]):
     
     batch_size = 10_000
     per_job_skills = []
+    engine = EmbeddingEngine()
 
     descriptions = df['Description'].tolist()
 
@@ -435,8 +436,9 @@ def search_for_skills_batch(df: pd.DataFrame, skills_list: List[str]):
         _, per_job_skills_batch, all_used_skills, all_new_skills = extract_skills_batched(
             job_descriptions=batch,
             skills=skills_list,
-            model=EmbeddingEngine().model,
+            model=engine.model,
             threshold=0.75,
+            model_name=engine.model_name,
         )
 
         per_job_skills.extend(per_job_skills_batch)
@@ -447,24 +449,26 @@ def search_for_skills_batch(df: pd.DataFrame, skills_list: List[str]):
 
 def search_for_skills_and_find_new_ones(df: pd.DataFrame, skills_list: List[str]):
 
-
+    engine = EmbeddingEngine()
     _, per_job_skills, all_used_skills,all_new_skills = extract_skills_batched(
         job_descriptions=df['Description'].tolist(),
         skills=skills_list,
-        model=EmbeddingEngine().model,
-        threshold=0.75
+        model=engine.model,
+        threshold=0.75,
+        model_name=engine.model_name
     )
     # Attach skills to subset and merge back into full dataframe
 
     print(f"Starting new skill discovery from {len(all_new_skills)} candidates...")
     print(f"Start cleaning new skill candidates... to remove non nouns and named entities")
-    cleaned_new_skills_stage1 = pos_filter(all_new_skills, spacy.load(f"{language}_core_web_sm"))[0]
-    cleaned_new_skills = ner_filter(cleaned_new_skills_stage1, spacy.load(f"{language}_core_web_sm"))[0]
+    nlp = get_spacy(f"{language}_core_web_sm")
+    cleaned_new_skills_stage1 = pos_filter(all_new_skills, nlp)[0]
+    cleaned_new_skills = ner_filter(cleaned_new_skills_stage1, nlp)[0]
 
     discover_new_skills_list, discover_new_skills_with_freq, labels = discover_new_skills(
         all_new_terms=cleaned_new_skills,
-        all_new_embeddings=EmbeddingEngine().embed(cleaned_new_skills),
-        canonical_emb=EmbeddingEngine().embed(skills_list),
+        all_new_embeddings=engine.embed(cleaned_new_skills),
+        canonical_emb=engine.embed(skills_list),
         min_frequency=3,
         n_clusters=5
     )
@@ -1,8 +1,10 @@
 import pickle
 import json
-from sentence_transformers import SentenceTransformer, util
-
-sbert_model = SentenceTransformer('all-MiniLM-L6-v2')
+import sys
+from pathlib import Path
+from sentence_transformers import util
+sys.path.append(str(Path(__file__).parent.parent))
+from data_processing.model_registry import get_sentence_model
 
 
 def rank_jobs(jobs, required_skills, top_n=50):
@@ -26,8 +28,8 @@ def rank_jobs(jobs, required_skills, top_n=50):
     with open('skill_relations/areas.json', 'r', encoding='utf-8') as f:
         all_areas = set(json.load(f))
     
-    # Load SBERT model for similarity
-    model = SentenceTransformer('all-MiniLM-L6-v2')
+    # Shared SBERT model for similarity, loaded once per process
+    model = get_sentence_model('all-MiniLM-L6-v2')
     
     def is_skill(item):
         return item in all_skills
@@ -59,8 +61,8 @@ def rank_jobs(jobs, required_skills, top_n=50):
                 
                 # If job_skill is an area and req is in that area: half match
                 elif is_area(job_skill) and is_skill(req) and req in areas_to_skills.get(job_skill, []):
-                    embed_p = sbert_model.encode(job_skill, convert_to_tensor=True)
-                    embed_h = sbert_model.encode(req, convert_to_tensor=True)
+                    embed_p = model.encode(job_skill, convert_to_tensor=True)
+                    embed_h = model.encode(req, convert_to_tensor=True)
                     sim = util.cos_sim(embed_p, embed_h).item()
                     score += 0.2 + sim * 0.8  # Scale similarity to 0.2-0.8
                     matched = True
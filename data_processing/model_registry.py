@@ -0,0 +1,52 @@
+import threading
+from pathlib import Path
+from typing import Dict
+
+# Process-wide SentenceTransformer and spaCy models. Each model is loaded the
+# first time it is asked for and then shared by every caller in the process.
+_models: Dict[str, object] = {}
+_lock = threading.Lock()
+
+# Short names used in this repo for models published under sentence-transformers/
+SBERT_SHORT_NAMES = {"all-MiniLM-L6-v2"}
+
+
+def canonical_model_name(name: str) -> str:
+    """
+    Hub id of a SentenceTransformer, so 'all-MiniLM-L6-v2' and 'sentence-transformers/all-MiniLM-L6-v2'
+    share one model. Other names, including local model directories, are kept as given.
+    """
+    if name in SBERT_SHORT_NAMES and not Path(name).exists():
+        return f"sentence-transformers/{name}"
+    return name
+
+
+def _get(key: str, load):
+    model = _models.get(key)
+    if model is None:
+        with _lock:
+            model = _models.get(key)
+            if model is None:
+                print(f"Loading {key}")
+                model = load()
+                _models[key] = model
+    return model
+
+
+def get_sentence_model(name: str = "all-MiniLM-L6-v2"):
+    def load():
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(canonical_model_name(name))
+        # the name embedding_cache keys this model's vectors by
+        model.registry_name = canonical_model_name(name)
+        return model
+
+    return _get(f"sbert:{canonical_model_name(name)}", load)
+
+
+def get_spacy(name: str = "en_core_web_sm"):
+    def load():
+        import spacy
+        return spacy.load(name)
+
+    return _get(f"spacy:{name}", load)
@@ -1,9 +1,9 @@
 import pandas as pd
 from pathlib import Path
-import re
 from tqdm import tqdm
 import numpy as np
 import time
+from skill_matcher import SkillMatcher
 parent_dir = Path(__file__).parent
 
 p = parent_dir.parent / "data_pipeline" / "data" / "job_data" / "ALL_JOBS.csv.gz"
@@ -19,10 +19,8 @@ def add_skills_column(df, skills_list):
     take = max(1, total // 8)
     print(f"Using 1/8 of dataset: {take}/{total} rows")
 
-    # Build regex
-    sorted_skills = sorted(skills_list, key=len, reverse=True)
-    regex = r"\b(?:" + "|".join(re.escape(s) for s in sorted_skills) + r")\b"
-    pattern = re.compile(regex, re.IGNORECASE)
+    # Build the keyword matcher (same matches as the \b(?:skill|...)\b regex)
+    matcher = SkillMatcher(skills_list)
 
     print(f"Database columns: {df.columns.tolist()}")
     list_of_skills = []
@@ -30,9 +28,7 @@ def add_skills_column(df, skills_list):
     start_time = time.time()
     # iterate with a progress bar
     for idx, description in enumerate(tqdm(df["Description"], desc="Extracting skills", unit="row", total=len(df))):
-        matches = pattern.findall(str(description))
-        unique_skills = sorted({m.title() for m in matches})
-        list_of_skills.append(unique_skills)
+        list_of_skills.append(matcher.extract(str(description)))
     # End timing
     end_time = time.time()
     extraction_time = end_time - start_time
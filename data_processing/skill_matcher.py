@@ -0,0 +1,147 @@
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+# Keyword matcher with the semantics of
+#     re.compile(r"\b(?:" + "|".join(re.escape(s) for s in sorted(skills, key=len, reverse=True)) + r")\b", re.I).findall
+# but without trying thousands of alternatives at every position: the skills are
+# stored in a trie of case-folded characters, which is only walked from word
+# boundaries and keeps the longest skill that also ends on a word boundary.
+
+_BOUNDARY = re.compile(r"\b")
+_END = None  # trie key marking that a skill ends at this node
+EXTRACT_CHUNK_SIZE = 500  # descriptions per worker task
+
+
+@lru_cache(maxsize=None)
+def _fold(c: str) -> str:
+    """
+    One character as re.IGNORECASE compares it: its simple lowercase, with
+    case variants such as 'ſ'/'s' or 'ς'/'σ' mapped together via their uppercase.
+    """
+    upper = c.upper()
+    return (upper if len(upper) == 1 else c).lower()[0]
+
+
+def fold_text(text: str) -> str:
+    """
+    Case-fold text character by character, so positions still line up with the original
+    """
+    if text.isascii():
+        return text.lower()
+    return "".join(map(_fold, text))
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def read_skill_list(skill_path) -> List[str]:
+    """
+    Skills and categories from a skill list: 'Category:' lines, '- skill' lines and plain
+    lines. Skills come first, then categories.
+    """
+    categories = []
+    skills = []
+    with open(skill_path, "r", encoding="utf-8") as f:
+        for line in f:
+            clean_line = line.strip()
+            if clean_line:
+                if clean_line.endswith(':'):
+                    # It's a category (remove the colon)
+                    categories.append(clean_line[:-1])
+                elif clean_line.startswith('-'):
+                    # It's a skill (remove the dash)
+                    skills.append(clean_line[1:].strip())
+                else:
+                    # Some other text, add as is
+                    skills.append(clean_line)
+    return skills + categories
+
+
+class SkillMatcher:
+    """
+    Case-insensitive, word-boundary aware, longest-match finder for a fixed set of skills.
+    findall() returns the same matched substrings as the equivalent alternation regex.
+    """
+
+    def __init__(self, skills: List[str]):
+        self.root = {}
+        for skill in skills:
+            node = self.root
+            for c in fold_text(skill):
+                node = node.setdefault(c, {})
+            node[_END] = True
+
+    def findall(self, text: str) -> List[str]:
+        folded = fold_text(text)
+        n = len(text)
+        matches = []
+        last_end = 0
+        for m in _BOUNDARY.finditer(text):
+            start = m.start()
+            if start < last_end:
+                continue
+            node = self.root
+            end = start if _END in node else -1
+            i = start
+            while i < n:
+                node = node.get(folded[i])
+                if node is None:
+                    break
+                i += 1
+                # a skill may only end where the regex's closing \b would hold
+                if _END in node and _is_word(text[i - 1]) != (i < n and _is_word(text[i])):
+                    end = i
+            if end >= 0:
+                matches.append(text[start:end])
+                last_end = end
+        return matches
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Sorted unique skills of a text, title-cased as stored in the Skills column
+        """
+        return sorted({m.title() for m in self.findall(text)})
+
+
+_worker_matcher: Optional[SkillMatcher] = None
+
+
+def _init_worker(skills: List[str]) -> None:
+    # built once per worker process, not once per chunk
+    global _worker_matcher
+    _worker_matcher = SkillMatcher(skills)
+
+
+def _extract_chunk(descriptions: List[str]) -> List[List[str]]:
+    return [_worker_matcher.extract(d) for d in descriptions]
+
+
+def extract_skills(descriptions: Iterable, skills: List[str], workers: Optional[int] = 1,
+                   chunk_size: int = EXTRACT_CHUNK_SIZE) -> List[List[str]]:
+    """
+    SkillMatcher(skills).extract for every description, in input order. With workers > 1
+    (None = all cores) chunks of descriptions are matched in a process pool.
+    """
+    start_time = time.time()
+    descriptions = [str(d) for d in descriptions]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(descriptions) <= chunk_size:
+        workers = 1
+        matcher = SkillMatcher(skills)
+        results = [matcher.extract(d) for d in descriptions]
+    else:
+        chunks = [descriptions[start:start + chunk_size] for start in range(0, len(descriptions), chunk_size)]
+        results = []
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(skills,)) as pool:
+            # map yields chunk results in submission order, so the output is deterministic
+            for chunk_skills in pool.map(_extract_chunk, chunks):
+                results.extend(chunk_skills)
+    print(f"Extracted skills from {len(descriptions)} descriptions in {time.time() - start_time:.2f}s ({workers} workers)")
+    return results